@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import NamedTuple
+
+
+class SpriteSheetAsset(NamedTuple):
+    # same arguments as Renderer.load_spritesheet
+    path: Path
+    rows: int
+    cols: int
+    images: int
+
+
+class AssetManifest:
+    """
+    Textures and sprite sheets a scene needs, so the renderer can load them before the scene is shown.
+    Entries are image paths, SpriteSheetAssets, or anything with an `assets` attribute holding more entries
+    (object classes declare what they load in on_renderer_ready that way).
+    """
+
+    def __init__(self, *entries):
+        # dicts as ordered sets, loaded in declaration order
+        self.images: dict[Path, None] = {}
+        self.sheets: dict[SpriteSheetAsset, None] = {}
+        self.add(*entries)
+
+    def __len__(self):
+        return len(self.images) + len(self.sheets)
+
+    def add(self, *entries):
+        for entry in entries:
+            if isinstance(entry, SpriteSheetAsset):
+                self.images[Path(entry.path)] = None
+                self.sheets[entry._replace(path=Path(entry.path))] = None
+            elif hasattr(entry, 'assets'):
+                self.add(*entry.assets)
+            else:
+                self.images[Path(entry)] = None
+        return self
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+from src.engine.config import *
+from src.engine.utils import *
+
+ATLAS_SIZE = 2048  # maximum page width
+PADDING = 1  # transparent gutter between images, so rotated copies never sample a neighbour
+
+
+def pack(images: dict[str, pygame.Surface], max_width=ATLAS_SIZE, padding=PADDING):
+    """
+    Shelf-packs the images (tallest first) into a single surface.
+    Returns the page and the rect of every image inside it, by name.
+    """
+    order = sorted(images, key=lambda i: (-images[i].get_height(), -images[i].get_width(), i))
+    rects: dict[str, pygame.Rect] = {}
+    x = y = shelf_height = width = 0
+    for name in order:
+        w, h = images[name].get_size()
+        w, h = w + padding * 2, h + padding * 2
+        if x + w > max_width and x > 0:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        rects[name] = pygame.Rect(x + padding, y + padding, w - padding * 2, h - padding * 2)
+        x += w
+        shelf_height = max(shelf_height, h)
+        width = max(width, x)
+    page = pygame.Surface((max(width, 1), max(y + shelf_height, 1)), pygame.SRCALPHA)
+    for name, rect in rects.items():
+        page.blit(images[name], rect)
+    return page, rects
+
+
+def get_atlas_source(name):
+    return get_path('images', name)
+
+
+def get_atlas_files(name):
+    return get_path('atlas', f'{name}.png'), get_path('atlas', f'{name}.json')
+
+
+def get_atlas_images(name):
+    return [i for i in sorted(os.listdir(get_atlas_source(name))) if i.endswith('.png')]
+
+
+def get_atlas_key(name):
+    # names and contents of the source images (mtimes don't survive a git checkout)
+    folder = get_atlas_source(name)
+    digest = hashlib.sha1(repr((ATLAS_SIZE, PADDING)).encode())
+    for i in get_atlas_images(name):
+        digest.update(i.encode() + b'\0')
+        digest.update((folder / i).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_atlas(name):
+    # packs every png under assets/images/<name>
+    folder = get_atlas_source(name)
+    return pack({i: load_image_without_cache(folder / i) for i in get_atlas_images(name)})
+
+
+def export_atlas(name):
+    page, rects = build_atlas(name)
+    page_path, index_path = get_atlas_files(name)
+    page_path.parent.mkdir(parents=True, exist_ok=True)
+    pygame.image.save(page, page_path)
+    with open(index_path, 'w') as f:
+        json.dump({'key': get_atlas_key(name), 'rects': {i: list(j) for i, j in rects.items()}}, f, indent=1)
+    return page, rects
+
+
+def load_atlas(name):
+    """
+    The packed page and rect index for assets/images/<name>.
+    Uses the prebuilt files in assets/atlas (python -m src.engine.atlas) when the key stored in the index
+    matches the current images, otherwise packs at runtime.
+    """
+    page_path, index_path = get_atlas_files(name)
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index['key'] == get_atlas_key(name):
+            rects = {i: pygame.Rect(j) for i, j in index['rects'].items()}
+            return pygame.image.load(page_path), rects
+    except (OSError, ValueError, KeyError, TypeError, pygame.error):
+        pass
+    return build_atlas(name)
+
+
+if __name__ == '__main__':
+    # python -m src.engine.atlas (rebuilds the prebuilt atlases)
+    for _name in Config.ATLASES:
+        _page, _rects = export_atlas(_name)
+        print(f'{_name}: {len(_rects)} images in {_page.get_width()}x{_page.get_height()}')
@@ -0,0 +1,124 @@
+from collections import OrderedDict
+from functools import wraps
+
+import pygame
+
+from src.engine.config import Config
+
+_MISSING = object()
+_KWARGS = object()  # separates positional from keyword arguments in keys
+_VALUE_SIZE = 64  # what a non-surface result (a size tuple) is counted as
+
+
+def get_size(value):
+    if isinstance(value, pygame.Surface):
+        return value.get_bytesize() * value.get_width() * value.get_height()
+    return _VALUE_SIZE
+
+
+class SurfaceCache:
+    """
+    LRU cache for generated surfaces bounded by the bytes of pixel data it holds rather than by entry count,
+    so a few huge glows and thousands of small text surfaces share one predictable budget.
+    Entries are grouped in namespaces, each optionally capped by its own quota (a namespace over its quota
+    evicts its own least recently used entries first); results larger than the quota are returned uncached.
+    """
+
+    def __init__(self, budget=Config.SURFACE_CACHE_BUDGET, quotas=None):
+        self.budget = budget
+        self.quotas: dict[str, int] = dict(quotas or {})
+        self.entries: dict[str, OrderedDict] = {}  # namespace -> key -> (value, size, last use)
+        self.bytes = 0
+        self.stats: dict[str, dict[str, int]] = {}
+        self._clock = 0
+
+    def _namespace(self, namespace):
+        if namespace not in self.entries:
+            self.entries[namespace] = OrderedDict()
+            self.stats[namespace] = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
+        return self.entries[namespace]
+
+    def get(self, namespace, key, default=None):
+        entries = self._namespace(namespace)
+        entry = entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.stats[namespace]['misses'] += 1
+            return default
+        self.stats[namespace]['hits'] += 1
+        self._clock += 1
+        entries[key] = entry[0], entry[1], self._clock
+        entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, namespace, key, value):
+        entries = self._namespace(namespace)
+        size = get_size(value)
+        quota = min(self.quotas.get(namespace, self.budget), self.budget)
+        if size > quota:
+            return
+        if key in entries:
+            self._remove(namespace, key)
+        self._clock += 1
+        entries[key] = value, size, self._clock
+        self.bytes += size
+        self.stats[namespace]['bytes'] += size
+        while self.stats[namespace]['bytes'] > quota:
+            self._evict(namespace, next(iter(entries)))
+        while self.bytes > self.budget:
+            self._evict(*self._least_recently_used())
+
+    def _least_recently_used(self):
+        # each namespace's least recently used entry is the first in its dict, compare their last uses
+        namespace = min((i for i in self.entries if self.entries[i]),
+                        key=lambda i: next(iter(self.entries[i].values()))[2])
+        return namespace, next(iter(self.entries[namespace]))
+
+    def _remove(self, namespace, key):
+        _, size, _ = self.entries[namespace].pop(key)
+        self.bytes -= size
+        self.stats[namespace]['bytes'] -= size
+
+    def _evict(self, namespace, key):
+        self._remove(namespace, key)
+        self.stats[namespace]['evictions'] += 1
+
+    def clear(self, namespace=None):
+        for i in [namespace] if namespace is not None else list(self.entries):
+            if i in self.entries:
+                self.bytes -= self.stats[i]['bytes']
+                self.stats[i]['bytes'] = 0
+                self.entries[i].clear()
+
+    def get_stats(self):
+        hits = sum(i['hits'] for i in self.stats.values())
+        misses = sum(i['misses'] for i in self.stats.values())
+        return {
+            'bytes': self.bytes, 'budget': self.budget, 'hits': hits, 'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'namespaces': {i: dict(j, entries=len(self.entries[i])) for i, j in self.stats.items()},
+        }
+
+
+SURFACE_CACHE = SurfaceCache(Config.SURFACE_CACHE_BUDGET, Config.SURFACE_CACHE_QUOTAS)
+
+
+def surface_cache(namespace, cache: SurfaceCache = SURFACE_CACHE):
+    """Memoizes a surface generator in the shared SurfaceCache (in place of an entry-count lru_cache)"""
+
+    def decorator(func):
+        name = func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, *args, _KWARGS, *kwargs.items()) if kwargs else (name, *args)
+            value = cache.get(namespace, key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(namespace, key, value)
+            return value
+
+        wrapper.cache_clear = lambda: cache.clear(namespace)
+        wrapper.cache_info = lambda: cache.stats.get(namespace)
+        return wrapper
+
+    return decorator
@@ -19,8 +19,13 @@ class Camera(BaseStructure):
         self.target_offset = self.offset
         self.target_rotation = self.rotation
         self.shake_intensity = 0
+        # state at the previous simulation tick, for render interpolation
+        self.prev_zoom = self.zoom
+        self.prev_offset = self.offset
+        self.prev_rotation = self.rotation
 
     def update(self, events: list[pygame.event.Event], dt):
+        self.prev_zoom, self.prev_offset, self.prev_rotation = self.zoom, self.offset, self.rotation
         for e in events:
             if e.type == EVENTS.CAMERA_UPDATE:
                 try:
@@ -63,7 +68,7 @@ class Camera(BaseStructure):
             self.zoom_smooth_factor = factor
         self.target_zoom = zoom
         if force:
-            self.zoom = self.target_zoom
+            self.zoom = self.prev_zoom = self.target_zoom
 
     def set_rotation(self, rotation, factor=None):
         if factor:
@@ -81,10 +86,22 @@ class Camera(BaseStructure):
             self.offset_smooth_factor = factor
         self.target_offset = pygame.Vector2(*position)
         if force:
-            self.offset = self.target_offset
+            self.offset = self.prev_offset = self.target_offset
 
     def move(self, dx, dy, factor=None):
         self.set_position(self.offset + pygame.Vector2(dx, dy).rotate(-self.rotation), factor)
 
-    def get_offset(self):
-        return self.offset + pygame.Vector2(get_random(-1, 1), get_random(-1, 1)) * self.shake_intensity
+    def world_to_screen(self, pos):
+        # where a world position currently is on screen (ignoring shake)
+        center = pygame.Vector2(Config.WIDTH / 2, Config.HEIGHT / 2)
+        return (pygame.Vector2(pos) - self.offset).rotate(self.rotation) * self.zoom + center
+
+    def get_offset(self, alpha=1.0):
+        offset = self.offset if alpha >= 1 else self.prev_offset.lerp(self.offset, alpha)
+        return offset + pygame.Vector2(get_random(-1, 1), get_random(-1, 1)) * self.shake_intensity
+
+    def get_zoom(self, alpha=1.0):
+        return self.zoom if alpha >= 1 else lerp(self.prev_zoom, self.zoom, alpha)
+
+    def get_rotation(self, alpha=1.0):
+        return self.rotation if alpha >= 1 else lerp_angle(self.prev_rotation, self.rotation, alpha)
@@ -24,6 +24,13 @@ class Config:
     SDL_VERSION = 2
     GAME_NAME = 'AstraWreck'
     ROOT_SCENE = 'acceptcontract'
+    PRELOAD_SCENES = True  # construct the likely next scenes (Scene.next_scenes) while a transition is closing
+    PRELOAD_BUDGET = 0.004  # seconds per tick spent constructing preloaded scenes (Scene.build steps)
+    BLUEPRINT_CHUNK = 32  # blueprint rows built per construction step
+    PREWARM_BUDGET = 0.004  # seconds per frame spent loading the next scene's assets during a transition
+    CAPTURE_OUTGOING_SCENE = True  # freeze the scene being left on its last frame while a transition closes
+    TEXT_RUN_CACHE_SIZE = 256  # laid out strings kept by Renderer.text
+    ATLASES = ('space_station', 'ships', 'vfx')  # image folders packed into one texture each (src.engine.atlas)
     GAME_TOP_DOWN = False
     WIDTH = 1280  # width of the screen
     HEIGHT = 720  # height of the screen
@@ -33,17 +40,33 @@ class Config:
     BG_COlOR = '#001018'
     TEXT_COLOR = '#511309'
     VOLUME = 100  # sound volume
+    SOUND_LOADER_THREADS = 4  # threads decoding sounds at startup (see SoundManager.load_sounds)
+    AUDIO_RANGE = (1.0, 2.5)  # world sounds are at full volume up to, and silent past, these many half screen widths from the centre
+    AUDIO_CUTOFF = 0.05  # world sounds quieter than this (0 - 1) are skipped before reaching the mixer
+    SOUND_VOICES = 32  # mixer channels effects can play on at once (plus one reserved for background music)
     FPS = 120
     TARGET_FPS = 60
+    TICK_RATE = 60  # fixed simulation steps per second, independent of the render rate
+    MAX_CATCHUP_TICKS = 5  # simulation steps allowed per rendered frame before the backlog is dropped
+    INTERPOLATE = True  # render objects between their previous and current simulated positions
     VSYNC = False
     SHOW_FPS = True
 
     SMALL_TEXT = 25
     MEDIUM_TEXT = 50
     LARGE_TEXT = 75
+    ERROR_TEXT_SIZES = (*range(5, 50, 2), 50)  # sizes the error overlay steps through with +/-
+    # (size, outline) variants rasterized into the glyph atlas at startup (src.engine.glyphs), others are made on use
+    TEXT_VARIANTS = tuple((i, 0) for i in sorted({SMALL_TEXT, MEDIUM_TEXT, LARGE_TEXT, *ERROR_TEXT_SIZES}))
 
     TIME_SCALE = 1
 
+    SPATIAL_HASH_CELL_SIZE = 64  # world units per broadphase grid cell
+    CULL_MARGIN = 32  # extra world units kept around the visible area before objects are culled
+    OBJECT_POOL_SIZE = 256  # dead instances kept per poolable class for reuse
+    SURFACE_CACHE_BUDGET = 64 * 1024 ** 2  # bytes of generated text / glow surfaces kept (src.engine.cache)
+    SURFACE_CACHE_QUOTAS = {'text': 16 * 1024 ** 2, 'glow': 48 * 1024 ** 2}  # optional caps per namespace
+
     PLATFORM_WEB = sys.platform == "emscripten"
     PIXELATED_ON_WEB = True
 
@@ -112,6 +135,7 @@ BASE_PATH = ''
 class GAMESTATS:
     SPEAKERS_INIT = False
     MOUSE_POS = [0, 0]
+    RENDER_ALPHA = 1.0  # how far the rendered frame is between the previous and current simulation step
     # OUTLINES = []
 
 
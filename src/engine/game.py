@@ -1,4 +1,5 @@
 import asyncio
+import time
 from pathlib import Path
 
 import pygame
@@ -6,7 +7,7 @@ import pygame
 from src.engine.config import *
 from src.engine.scene import SceneManager
 from src.engine.sounds import SoundManager
-from src.engine.utils import clamp, text
+from src.engine.utils import text
 from src.engine.video import Renderer
 
 
@@ -16,7 +17,7 @@ def init():
 
     try:
         pygame.mixer.init()
-        pygame.mixer.set_num_channels(128)
+        pygame.mixer.set_num_channels(Config.SOUND_VOICES + 1)
         GAMESTATS.SPEAKERS_INIT = True
         SoundManager.load_sounds()
     except pygame.error:
@@ -56,7 +57,7 @@ class Game:
 
         # self.renderer.print_render_drivers()
 
-        self.manager = SceneManager()
+        self.manager = SceneManager(self.renderer)
         self.clock = pygame.time.Clock()
 
     def toggle_full_screen(self):
@@ -70,8 +71,13 @@ class Game:
             self.renderer.toggle_full_screen()
 
     async def run(self):
-        dt = 1
+        # the simulation advances in fixed ticks; rendering runs as fast as fps allows and interpolates between ticks
+        step = 1 / Config.TICK_RATE
+        dt = Config.TARGET_FPS / Config.TICK_RATE  # dt is measured in TARGET_FPS frames
         fps = Config.FPS * 1
+        accumulator = 0.0
+        last_time = time.perf_counter()
+        pending_events = []
         while True:
             events = pygame.event.get()
             pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
@@ -91,7 +97,20 @@ class Game:
                 if e.type == EVENTS.MOUSE_HOVERED:
                     pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
             await asyncio.sleep(0)
-            self.manager.update(events, dt)
+            now = time.perf_counter()
+            accumulator += now - last_time
+            last_time = now
+            pending_events.extend(events)  # events are delivered with the next tick
+            ticks = 0
+            while accumulator >= step:
+                if ticks >= Config.MAX_CATCHUP_TICKS:
+                    accumulator = 0.0  # too far behind, drop the backlog instead of spiralling
+                    break
+                self.manager.update(pending_events, dt * Config.TIME_SCALE)
+                pending_events = []
+                accumulator -= step
+                ticks += 1
+            GAMESTATS.RENDER_ALPHA = accumulator / step if Config.INTERPOLATE else 1.0
             if Config.SDL_VERSION == 1:
                 self.manager.draw(self.screen, (0, 0))
                 t = text(int(self.clock.get_fps()).__str__(), color='white')
@@ -110,8 +129,3 @@ class Game:
                 self.renderer.present()
             SoundManager.update()
             self.clock.tick(fps)
-            try:
-                dt = Config.TARGET_FPS / self.clock.get_fps()
-            except ZeroDivisionError:
-                dt = 1
-            dt = clamp(dt * Config.TIME_SCALE, 0.01, 6)
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import string
+
+import pygame
+
+from src.engine.atlas import pack
+from src.engine.config import *
+from src.engine.utils import *
+
+GLYPHS = [i for i in string.printable if i == ' ' or i not in string.whitespace]
+
+
+def glyph_surface(char, size, outline=0):
+    if outline:
+        return text_with_outline(char, size, 'white', 'black', outline)
+    return text(char, size, 'white')
+
+
+def get_cache_key(variants):
+    # a different font, glyph set or freetype build rasterizes differently
+    digest = hashlib.sha1(get_path('fonts', FONT).read_bytes())
+    digest.update(repr((sorted(variants), GLYPHS, pygame.version.ver)).encode())
+    return digest.hexdigest()[:16]
+
+
+def build_glyph_atlas(variants):
+    """
+    Rasterizes every glyph of every (size, outline) variant into one page.
+    Returns the page and {(size, outline): {char: rect}}.
+    """
+    images = {
+        (size, outline, char): glyph_surface(char, size, outline) for size, outline in variants for char in GLYPHS
+    }
+    page, rects = pack(images)
+    index = {variant: {} for variant in variants}
+    for (size, outline, char), rect in rects.items():
+        index[size, outline][char] = rect
+    return page, index
+
+
+def load_glyph_atlas(variants=Config.TEXT_VARIANTS):
+    """
+    build_glyph_atlas, cached in .cache/glyphs so later runs only decode one png.
+    The cache is skipped silently where it can't be written (web builds).
+    """
+    key = get_cache_key(variants)
+    page_path, index_path = get_cache_path('glyphs', f'{key}.png'), get_cache_path('glyphs', f'{key}.json')
+    try:
+        with open(index_path) as f:
+            index = {
+                (size, outline): {chr(int(char)): pygame.Rect(rect) for char, rect in rects.items()}
+                for size, outline, rects in json.load(f)
+            }
+        return pygame.image.load(page_path), index
+    except (OSError, ValueError, pygame.error):
+        pass
+    page, index = build_glyph_atlas(variants)
+    try:
+        page_path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(page, page_path)
+        with open(index_path, 'w') as f:
+            json.dump([
+                [size, outline, {ord(char): list(rect) for char, rect in rects.items()}]
+                for (size, outline), rects in index.items()
+            ], f)
+    except OSError:
+        pass
+    return page, index
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+from typing import Callable, Iterable, Union
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from src.engine.config import *
+from src.engine.scene import SceneManager
+from src.engine.video import HeadlessRenderer
+
+InputStream = Union[Callable[[int], Iterable[pygame.event.Event]], Iterable[Iterable[pygame.event.Event]], None]
+
+
+def key_events(key, unicode=''):
+    # KEYDOWN + KEYUP pair for scripted input (held keys via pygame.key.get_pressed are not simulated)
+    return [
+        pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0),
+        pygame.event.Event(pygame.KEYUP, key=key, unicode=unicode, mod=0, scancode=0),
+    ]
+
+
+class HeadlessRunner:
+    """
+    Steps scenes at full speed without a window, renderer or audio.
+    Used to measure simulation throughput separately from GPU and present time, and for automated runs.
+
+    input_stream is either None (no input), a callable taking the tick number and returning events,
+    or an iterable yielding a list of events per tick.
+    """
+
+    def __init__(self, scene=Config.ROOT_SCENE, input_stream: InputStream = None):
+        pygame.init()
+        GAMESTATS.SPEAKERS_INIT = False
+        self.renderer = HeadlessRenderer()
+        self.manager = SceneManager(self.renderer)
+        if scene != self.manager.mode:
+            self.manager.switch_mode(scene)
+        self.set_input(input_stream)
+        self.ticks = 0
+
+    def set_input(self, input_stream: InputStream):
+        if input_stream is None or callable(input_stream):
+            self._input_func = input_stream
+            self._input_iter = None
+        else:
+            self._input_func = None
+            self._input_iter = iter(input_stream)
+
+    def get_input(self, tick) -> list[pygame.event.Event]:
+        if self._input_func is not None:
+            return list(self._input_func(tick))
+        if self._input_iter is not None:
+            return list(next(self._input_iter, []))
+        return []
+
+    def step(self, dt=None):
+        if dt is None:
+            dt = Config.TARGET_FPS / Config.TICK_RATE * Config.TIME_SCALE
+        events = pygame.event.get() + self.get_input(self.ticks)  # also picks up events posted by objects
+        self.manager.update(events, dt)
+        # stands in for the first render so sprite sizes (and get_rect) are available
+        self.manager.menu.object_manager.prepare_renderer(self.renderer)
+        self.ticks += 1
+
+    def run(self, ticks):
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step()
+        elapsed = time.perf_counter() - start
+        return {
+            'scene': self.manager.mode,
+            'ticks': ticks,
+            'seconds': elapsed,
+            'ticks_per_second': ticks / elapsed if elapsed else float('inf'),
+            'objects': len(self.manager.menu.object_manager.objects),
+        }
+
+
+if __name__ == '__main__':
+    # python -m src.engine.headless [scene] [ticks]
+    _scene = sys.argv[1] if len(sys.argv) > 1 else Config.ROOT_SCENE
+    _ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    report = HeadlessRunner(_scene).run(_ticks)
+    print(f"{report['scene']}: {report['ticks']} ticks in {report['seconds']:.3f}s "
+          f"({report['ticks_per_second']:.1f} ticks/s, {report['objects']} objects)")
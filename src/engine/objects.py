@@ -1,5 +1,6 @@
+from bisect import insort
 from operator import attrgetter
-from typing import Union, Sequence
+from typing import Callable, Union, Sequence
 
 import pygame.event
 import pymunk
@@ -7,15 +8,25 @@ import pymunk
 from src.engine.base import BaseStructure
 from src.engine.camera import Camera
 from src.engine.config import *
+from src.engine.scheduler import Scheduler, ScheduledCallback
+from src.engine.tween import TweenEngine, ValueAnimator
 from src.engine.utils import *
 from src.engine.video import Renderer
 
 
 class BaseObject(BaseStructure):
+    collidable = False  # indexed in the object manager's spatial hash when True
+    cullable = True  # skipped while off-screen; disable for parallax layers and screen-space objects
+    poolable = False  # dead instances are kept by the object manager and recycled by ObjectManager.acquire
+    assets = ()  # textures / sprite sheets loaded in on_renderer_ready, see AssetManifest
+
     def __init__(self, x=0.0, y=0.0, z=LAYERS.OBJECTS_LAYER):
         self.x, self.y = x, y
+        # position at the previous simulation tick, for render interpolation; kept by the object manager for
+        # objects moving through move / move_to / pos, so set positions through those rather than x and y
+        self.prev_x, self.prev_y = x, y
         self.alive = True
-        self.z = z  # for sorting
+        self.z = z  # for sorting (use ObjectManager.change_layer once added)
         self.object_manager: Union[ObjectManager, None] = None
         self.first_render = False
 
@@ -25,8 +36,18 @@ class BaseObject(BaseStructure):
     def on_renderer_ready(self, renderer: Renderer):
         pass
 
+    def on_acquire(self, *args, **kwargs):
+        # called instead of the constructor when a pooled instance is recycled; override for a cheaper reset
+        self.__init__(*args, **kwargs)
+
+    def on_release(self):
+        # called when a dead instance is returned to its pool
+        pass
+
     def destroy(self):
         self.alive = False
+        if self.object_manager is not None:
+            self.object_manager.on_object_destroyed(self)
 
     def constrain_to_rect(self, rect: pygame.Rect):
         self_rect = self.rect
@@ -58,13 +79,22 @@ class BaseObject(BaseStructure):
     def get_rect(self):
         raise NotImplementedError
 
+    def get_render_rect(self):
+        # world-space bounds of what render draws, used for viewport culling
+        return self.get_rect()
+
     def move(self, dx, dy):
         self.x += dx
         self.y += dy
+        if self.object_manager is not None and (dx or dy):
+            self.object_manager.on_object_moved(self)
 
-    def move_to(self, x, y):
+    def move_to(self, x, y, interpolate=True):
         dx, dy = x - self.x, y - self.y
         self.move(dx, dy)
+        if not interpolate:
+            # placed rather than moved, drawn there from the next frame instead of sliding over
+            self.prev_x, self.prev_y = self.x, self.y
 
     def draw_glow(self, surf: pygame.Surface, offset):
         pass
@@ -183,7 +213,7 @@ class TrailStamp(BaseObject):
         self.alpha -= self.alpha_rate * dt
         self.alpha = clamp(self.alpha, 0, 255)
         if self.alpha <= 0:
-            self.alive = False
+            self.destroy()
         else:
             self.surf.set_alpha(self.alpha)
 
@@ -191,54 +221,10 @@ class TrailStamp(BaseObject):
         surf.blit(self.surf, self.surf.get_rect(center=self.pos))
 
 
-class ValueAnimator(BaseObject):
-    def __init__(self, value):
-        super().__init__(0, 0, 0)
-        self.value = value
-        self.next_anim = []
-        self.target = self.value
-        self.rate = 0.1
-        self.action = None
-
-    def reset(self, value=None):
-        if value:
-            self.value = value
-        self.target = self.value
-        self.next_anim.clear()
-
-    def new_anim(self, target, rate, action):
-        self.next_anim.append([target, rate, action])
-
-    def then(self, action):
-        self.new_anim(None, None, action)
-
-    def set(self, value, action=None):
-        return self.lerp(value, 1, action)
-
-    def lerp(self, to, by=0.5, action=None):
-        self.new_anim(to, by, action)
-        return self
-
-    def update(self, events: list[pygame.event.Event], dt):
-        if self.rate == 1:
-            self.value = self.target
-        else:
-            self.value = lerp(self.value, self.target, (1 - (1 - self.rate) ** dt))
-        if abs(self.target - self.value) <= 0.01:
-            self.value = self.target
-            if self.action:
-                self.action()
-                self.action = None
-            if self.next_anim:
-                target, rate, action = self.next_anim.pop(0)
-                self.action = action
-                self.target, self.rate = target, rate
-
-
 class AnimationStateObject(BaseObject):
     def __init__(self, sheet_path, rows, cols, images, state_info: dict, scale=1.0, timer=0.1):
         super().__init__(0, 0, LAYERS.OBJECTS_LAYER)
-        self.timer = TimerObject(timer, action=self.on_timer_tick)
+        self.timer = ScheduledCallback(timer, self.on_timer_tick, repeat=True)
         self.sheet_info = sheet_path, rows, cols, images
         self.images = []
         self.state_info = state_info
@@ -255,8 +241,25 @@ class AnimationStateObject(BaseObject):
     def on_frame_update(self):
         pass
 
+    def reset_state(self):
+        # back to the freshly constructed state, keeping the loaded images (for pooled reuse)
+        self.alive = True
+        self.curr_state = next(iter(self.state_info.keys()))
+        self.curr_frame = 0
+        self.curr_frame_index = 0
+        self.flip = [0, 0]
+        self.callback = None
+        self.lock = False
+        self._draw = True
+        self.timer.interval = self.default_timeout
+        self.timer.reset()
+
+    def on_ready(self):
+        self.object_manager.scheduler.add(self.timer)
+
     def destroy(self):
         super().destroy()
+        self.timer.cancel()
         self._draw = False
 
     def get_rect(self):
@@ -291,16 +294,13 @@ class AnimationStateObject(BaseObject):
                 self.callback = None
         index = self.state_info[self.curr_state][self.curr_frame]
         if isinstance(index, Sequence):
-            self.curr_frame_index, self.timer.timeout = index
+            self.curr_frame_index, self.timer.interval = index
         else:
-            self.curr_frame_index, self.timer.timeout = index, self.default_timeout
+            self.curr_frame_index, self.timer.interval = index, self.default_timeout
 
     def on_renderer_ready(self, renderer: Renderer):
         self.images = renderer.load_spritesheet(*self.sheet_info)
 
-    def update(self, events: list[pygame.event.Event], dt):
-        self.timer.update(events, dt)
-
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         if not self._draw:
             return
@@ -308,18 +308,274 @@ class AnimationStateObject(BaseObject):
         img.render(*(self.pos + offset), angle, self.scale * scale, self.flip)
 
 
+# render passes in draw order; objects only join the passes whose method they override
+RENDER_PASSES = ('render', 'render_glow', 'render_overlay')
+
+
+class SpatialHash:
+    """
+    Uniform grid over world space used as a collision broadphase.
+    Objects are re-bucketed only when they are marked dirty (i.e. when they move).
+    """
+
+    def __init__(self, cell_size=Config.SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set[BaseObject]] = {}
+        self.rects: dict[BaseObject, pygame.Rect] = {}
+        self._cell_ranges: dict[BaseObject, tuple[int, int, int, int]] = {}
+        self._dirty: set[BaseObject] = set()
+
+    def __len__(self):
+        return len(self.rects)
+
+    def _cell_range(self, rect: pygame.Rect):
+        size = self.cell_size
+        return rect.left // size, rect.top // size, rect.right // size, rect.bottom // size
+
+    def _link(self, _object: BaseObject, cell_range):
+        left, top, right, bottom = cell_range
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                try:
+                    self.cells[cx, cy].add(_object)
+                except KeyError:
+                    self.cells[cx, cy] = {_object}
+
+    def _unlink(self, _object: BaseObject, cell_range):
+        left, top, right, bottom = cell_range
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(_object)
+                    if not cell:
+                        del self.cells[cx, cy]
+
+    def mark_dirty(self, _object: BaseObject):
+        self._dirty.add(_object)
+
+    def insert(self, _object: BaseObject, rect: pygame.Rect):
+        self.rects[_object] = rect
+        cell_range = self._cell_range(rect)
+        old_range = self._cell_ranges.get(_object)
+        if old_range == cell_range:
+            return
+        if old_range is not None:
+            self._unlink(_object, old_range)
+        self._cell_ranges[_object] = cell_range
+        self._link(_object, cell_range)
+
+    def remove(self, _object: BaseObject):
+        self._dirty.discard(_object)
+        self.rects.pop(_object, None)
+        cell_range = self._cell_ranges.pop(_object, None)
+        if cell_range is not None:
+            self._unlink(_object, cell_range)
+
+    def refresh(self):
+        # re-bucket everything that moved since the last refresh
+        if not self._dirty:
+            return
+        pending = set()
+        for i in self._dirty:
+            if not i.alive:
+                self.remove(i)
+                continue
+            try:
+                rect = i.rect
+            except AttributeError:
+                # rect depends on renderer resources that are not loaded yet
+                pending.add(i)
+                continue
+            self.insert(i, rect)
+        self._dirty = pending
+
+    def clear(self):
+        self.cells.clear()
+        self.rects.clear()
+        self._cell_ranges.clear()
+        self._dirty.clear()
+
+    def _candidates(self, rect: pygame.Rect):
+        left, top, right, bottom = self._cell_range(rect)
+        seen = set()
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    continue
+                for i in cell:
+                    if i not in seen:
+                        seen.add(i)
+                        yield i
+
+    def query_rect(self, rect: pygame.Rect, instance=None) -> list[BaseObject]:
+        """Alive objects (optionally of a given type) whose rect collides with the given rect"""
+        rect = pygame.Rect(rect)
+        return [
+            i for i in self._candidates(rect)
+            if i.alive and (instance is None or isinstance(i, instance)) and self.rects[i].colliderect(rect)
+        ]
+
+    def query_radius(self, point, radius, instance=None) -> list[BaseObject]:
+        """Alive objects (optionally of a given type) whose rect lies within radius of the given point"""
+        x, y = point
+        rect = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+        objects = []
+        for i in self._candidates(rect):
+            if not i.alive or (instance is not None and not isinstance(i, instance)):
+                continue
+            r = self.rects[i]
+            dx = x - clamp(x, r.left, r.right)
+            dy = y - clamp(y, r.top, r.bottom)
+            if dx * dx + dy * dy <= radius * radius:
+                objects.append(i)
+        return objects
+
+
+class LayeredObjects:
+    """Read-only view of the object manager's layers, flattened in draw order without copying them"""
+    __slots__ = ('layers', 'order')
+
+    def __init__(self, layers: dict[float, dict[BaseObject, None]], order: list[float]):
+        self.layers = layers
+        self.order = order
+
+    def __iter__(self):
+        layers = self.layers
+        for z in self.order:
+            yield from layers[z]
+
+    def __len__(self):
+        return sum(len(i) for i in self.layers.values())
+
+
 class ObjectManager(BaseStructure):
     def __init__(self):
-        self.objects: list[BaseObject] = []
+        # z -> members in draw order (insertion ordered, so removal is O(1) and keeps the order)
+        self.layers: dict[float, dict[BaseObject, None]] = {}
+        self._layer_order: list[float] = []  # sorted layer keys
+        self._layer_of: dict[BaseObject, float] = {}
+        self._objects = LayeredObjects(self.layers, self._layer_order)
+        self._dead: set[BaseObject] = set()
+        self._moved: set[BaseObject] = set()  # moved since the last tick, prev positions are snapshotted next tick
+        self._relayered: dict[BaseObject, None] = {}  # objects whose z changed, moved between ticks
+        self._unsorted_layers: set[float] = set()  # layers needing a y-sort (top-down games only)
         self._to_add: list[BaseObject] = []
+        self._cullable_types: dict[type, bool] = {}
+        self._pass_types: dict[type, tuple[str, ...]] = {}  # class -> render passes it implements
+        # pass -> z -> {object: bound pass method}, in draw order and updated with the layers
+        self._passes: dict[str, dict[float, dict[BaseObject, Callable]]] = {name: {} for name in RENDER_PASSES}
+        self._renderables: dict[BaseObject, None] = {}  # objects taking part in at least one pass
+        self._pending_renderer_ready: list[BaseObject] = []
+        self._pools: dict[type, list[BaseObject]] = {}
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self._frame_offsets: dict[BaseObject, pygame.Vector2] = {}  # per-frame screen transform of visible objects
+        self._frame_scale = 1.0
+        self._frame_angle = 0.0
+        self.drawn_count = 0  # objects drawn / culled in the current frame
+        self.culled_count = 0
         self.collision_enabled = True
+        self.spatial_hash = SpatialHash()
+        self.scheduler = Scheduler()  # game-time callbacks for the objects of this manager
+        self.tweens = TweenEngine()  # steps every ValueAnimator added to this manager in one batch
+        self._types: dict[type, dict[BaseObject, None]] = {}  # concrete class -> live members (insertion ordered)
+        self._type_queries: dict[type | tuple, list[type]] = {}  # queried class -> matching concrete classes
         self.scene = None
         self.camera = Camera()
         from src.engine.physics import PhysicsManager
         self.physics_manager = PhysicsManager()
 
+    @property
+    def objects(self) -> LayeredObjects:
+        return self._objects
+
+    def _insert(self, _object: BaseObject):
+        z = _object.z
+        try:
+            layer = self.layers[z]
+        except KeyError:
+            layer = self.layers[z] = {}
+            insort(self._layer_order, z)
+            for layers in self._passes.values():
+                layers[z] = {}
+        layer[_object] = None
+        self._layer_of[_object] = z
+        names = self.get_pass_types(type(_object))
+        if names:
+            self._renderables[_object] = None
+            for name in names:
+                self._passes[name][z][_object] = getattr(_object, name)
+        if Config.GAME_TOP_DOWN:
+            self._unsorted_layers.add(z)
+
+    def _detach(self, _object: BaseObject):
+        z = self._layer_of.pop(_object)
+        layer = self.layers[z]
+        del layer[_object]
+        self._renderables.pop(_object, None)
+        for name in self.get_pass_types(type(_object)):
+            del self._passes[name][z][_object]
+        if not layer:
+            del self.layers[z]
+            self._layer_order.remove(z)
+            self._unsorted_layers.discard(z)
+            for layers in self._passes.values():
+                del layers[z]
+
+    def _remove_dead(self):
+        for i in self._dead:
+            if i not in self._layer_of:
+                continue  # never joined (or already left) the layers
+            self._detach(i)
+            self._unregister_type(i)
+            if i.collidable:
+                self.spatial_hash.remove(i)
+            if i.poolable:
+                self.release(i)
+        self._dead.clear()
+
+    def _sort_layer(self, z):
+        layer = self.layers[z] = dict.fromkeys(sorted(self.layers[z], key=attrgetter('y')))
+        for layers in self._passes.values():
+            members = layers[z]
+            layers[z] = {i: members[i] for i in layer if i in members}
+
+    def change_layer(self, _object: BaseObject, z):
+        # the move itself waits for the next tick, the layers may be being iterated
+        _object.z = z
+        if _object in self._layer_of:
+            self._relayered[_object] = None
+
+    def _matching_types(self, instance):
+        try:
+            return self._type_queries[instance]
+        except KeyError:
+            types = self._type_queries[instance] = [i for i in self._types if issubclass(i, instance)]
+            return types
+
+    def _register_type(self, _object: BaseObject):
+        cls = type(_object)
+        try:
+            self._types[cls][_object] = None
+        except KeyError:
+            self._types[cls] = {_object: None}
+            self._type_queries.clear()  # a new class may match existing queries
+
+    def _unregister_type(self, _object: BaseObject):
+        try:
+            self._types[type(_object)].pop(_object, None)
+        except KeyError:
+            pass
+
     def get_objects(self, instance):
-        return (i for i in self.objects if isinstance(i, instance))
+        # only walks the buckets of classes matching instance (subclasses included)
+        for cls in self._matching_types(instance):
+            yield from self._types[cls]
+
+    def count_objects(self, instance):
+        return sum(len(self._types[cls]) for cls in self._matching_types(instance))
 
     def create_walls_around_rect(self, rect, thickness, draw=False):
         walls = self.physics_manager.create_walls_around_rect(rect, thickness)
@@ -330,38 +586,142 @@ class ObjectManager(BaseStructure):
             p = PhysicsObject(body.position.x, body.position.y, shape.get_vertices(), 1000, pymunk.Body.STATIC, draw)
             self.add(p)
 
+    def query_rect(self, rect: pygame.Rect, instance=None) -> list[BaseObject]:
+        return self.spatial_hash.query_rect(rect, instance)
+
+    def query_radius(self, point, radius, instance=None) -> list[BaseObject]:
+        return self.spatial_hash.query_radius(point, radius, instance)
+
+    def on_object_moved(self, _object: BaseObject):
+        self._moved.add(_object)
+        if _object.collidable:
+            self.spatial_hash.mark_dirty(_object)
+        if Config.GAME_TOP_DOWN:
+            z = self._layer_of.get(_object)
+            if z is not None:
+                self._unsorted_layers.add(z)
+
+    def on_object_destroyed(self, _object: BaseObject):
+        self._dead.add(_object)
+
     def clear(self):
         self._to_add.clear()
-        self.objects.clear()
-
-    def add(self, _object: BaseObject):
+        self.layers.clear()
+        self._layer_order.clear()
+        self._layer_of.clear()
+        self._relayered.clear()
+        for layers in self._passes.values():
+            layers.clear()
+        self._renderables.clear()
+        self._pending_renderer_ready.clear()
+        self._frame_offsets.clear()
+        self._pools.clear()
+        self.scheduler.clear()
+        self.tweens.clear()
+        self._dead.clear()
+        self._moved.clear()
+        self._unsorted_layers.clear()
+        self.spatial_hash.clear()
+        self._types.clear()
+        self._type_queries.clear()
+
+    def add(self, _object: BaseObject | ValueAnimator):
+        if isinstance(_object, ValueAnimator):
+            self.tweens.add(_object)
+            return
         _object.object_manager = self
         self._to_add.append(_object)
 
+    def acquire(self, cls: type, *args, **kwargs):
+        """Adds an instance of cls, recycling a dead pooled one (through on_acquire) when available"""
+        pool = self._pools.get(cls)
+        if pool:
+            _object = pool.pop()
+            _object.on_acquire(*args, **kwargs)
+            _object.prev_x, _object.prev_y = _object.x, _object.y  # not interpolated from where it died
+            self.pool_hits += 1
+        else:
+            _object = cls(*args, **kwargs)
+            self.pool_misses += 1
+        self.add(_object)
+        return _object
+
+    def release(self, _object: BaseObject):
+        # only call for objects no longer in the manager; dead poolable objects are released automatically
+        _object.on_release()
+        try:
+            pool = self._pools[type(_object)]
+        except KeyError:
+            pool = self._pools[type(_object)] = []
+        if len(pool) < Config.OBJECT_POOL_SIZE:
+            pool.append(_object)
+
+    def pool_stats(self):
+        return {
+            'hits': self.pool_hits,
+            'misses': self.pool_misses,
+            'pooled': sum(len(i) for i in self._pools.values()),
+        }
+
     def add_multiple(self, _objects: list[BaseObject]):
         for i in _objects:
             self.add(i)
 
-    def update(self, events: list[pygame.event.Event], dt):
+    def flush(self):
+        """Applies pending additions, layer changes and removals without stepping anything"""
         from src.engine.physics import PhysicsObject
-        self.physics_manager.update(events, dt)
         if self._to_add:
             for i in self._to_add:
+                if not i.alive:
+                    # destroyed before it joined
+                    self._dead.discard(i)
+                    if i.poolable:
+                        self.release(i)
+                    continue
+                i.prev_x, i.prev_y = i.x, i.y
                 i.on_ready()
                 if isinstance(i, PhysicsObject):
                     i.on_physics_ready(self.physics_manager)
-            self.objects.extend(self._to_add)
+                if i.collidable:
+                    self.spatial_hash.mark_dirty(i)
+                self._register_type(i)
+                self._insert(i)
+                if not i.first_render:
+                    self._pending_renderer_ready.append(i)
             self._to_add.clear()
-        self.objects = [i for i in self.objects if i.alive]
-        if Config.GAME_TOP_DOWN:
-            self.objects.sort(key=attrgetter('z', 'y'))  # layers first, then y-sort (change if required)
-        else:
-            self.objects.sort(key=attrgetter('z'))
+        if self._relayered:
+            for i in self._relayered:
+                if i in self._layer_of and self._layer_of[i] != i.z:
+                    self._detach(i)
+                    self._insert(i)
+            self._relayered.clear()
+        if self._dead:
+            self._remove_dead()
+        if self._unsorted_layers:
+            for z in self._unsorted_layers:
+                self._sort_layer(z)  # y-sort within a layer (change if required)
+            self._unsorted_layers.clear()
+
+    def update(self, events: list[pygame.event.Event], dt):
+        if self._moved:
+            # objects that didn't move last tick still have prev == pos
+            for i in self._moved:
+                i.prev_x, i.prev_y = i.x, i.y
+            self._moved.clear()
+        self.physics_manager.update(events, dt)
+        self.flush()
         self.camera.update(events, dt)
-        for i in self.objects:
+        self.spatial_hash.refresh()
+        self.scheduler.update(dt)
+        self.tweens.update(dt)
+        objects = self.objects
+        dead = self._dead
+        for i in objects:
             if i.alive:
-                i.interact(self.objects)
+                i.interact(objects)
                 i.update(events, dt)
+            else:
+                dead.add(i)  # alive cleared without destroy(), removed next tick
 
     def draw(self, surf: pygame.Surface, offset, scale=1.0, angle=0.0):
         for i in self.objects:
@@ -375,38 +735,90 @@ class ObjectManager(BaseStructure):
         for i in self.objects:
             i.draw_overlay(surf, offset)
 
-    def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
-        offset += self.camera.get_offset()
-        scale *= self.camera.zoom
-        angle += self.camera.rotation
-        for i in self.objects:
-            pos = i.pos
+    @staticmethod
+    def get_view_rect(offset, scale=1.0, angle=0.0) -> pygame.Rect:
+        """World-space rect covering the screen for a camera at offset with the given zoom and rotation"""
+        # inverse of the render transform: screen = (world - offset).rotate(angle) * scale + center
+        half_w, half_h = Config.WIDTH / 2 / scale, Config.HEIGHT / 2 / scale
+        c1 = pygame.Vector2(half_w, half_h).rotate(-angle)
+        c2 = pygame.Vector2(half_w, -half_h).rotate(-angle)
+        w, h = max(abs(c1.x), abs(c2.x)), max(abs(c1.y), abs(c2.y))
+        rect = pygame.Rect(0, 0, (w + Config.CULL_MARGIN) * 2, (h + Config.CULL_MARGIN) * 2)
+        rect.center = offset
+        return rect
+
+    def is_cullable(self, _object: BaseObject):
+        cls = type(_object)
+        try:
+            return self._cullable_types[cls]
+        except KeyError:
+            # objects without bounds are always drawn
+            cullable = cls.cullable and (
+                    cls.get_render_rect is not BaseObject.get_render_rect or cls.get_rect is not BaseObject.get_rect
+            )
+            self._cullable_types[cls] = cullable
+            return cullable
+
+    def get_pass_types(self, cls: type) -> tuple[str, ...]:
+        try:
+            return self._pass_types[cls]
+        except KeyError:
+            passes = tuple(name for name in RENDER_PASSES if getattr(cls, name) is not getattr(BaseObject, name))
+            self._pass_types[cls] = passes
+            return passes
+
+    def prepare_renderer(self, renderer: Renderer):
+        # renderer-dependent setup for objects that joined since the last frame
+        if not self._pending_renderer_ready:
+            return
+        for i in self._pending_renderer_ready:
             if not i.first_render:
                 i.first_render = True
                 i.on_renderer_ready(renderer)
-            center = [Config.WIDTH / 2, Config.HEIGHT / 2]
-            i.render(renderer, (((pos - offset).rotate(angle)) * scale) - pos + center, scale, angle)
+        self._pending_renderer_ready.clear()
+
+    def begin_frame(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
+        """Culls and computes the screen transform of every renderable object once for all passes of a frame"""
+        self.prepare_renderer(renderer)
+        alpha = GAMESTATS.RENDER_ALPHA
+        offset = self.camera.get_offset(alpha) + offset
+        scale *= self.camera.get_zoom(alpha)
+        angle += self.camera.get_rotation(alpha)
+        self._frame_scale, self._frame_angle = scale, angle
+        center = pygame.Vector2(Config.WIDTH / 2, Config.HEIGHT / 2)
+        view = self.get_view_rect(offset, scale, angle)
+        offsets = self._frame_offsets
+        offsets.clear()
+        culled = 0
+        for i in self._renderables:
+            if self.is_cullable(i):
+                rect = i.get_render_rect()
+                if not (view.colliderect(rect) if rect.w and rect.h else view.collidepoint(rect.topleft)):
+                    culled += 1
+                    continue
+            pos = i.pos
+            # objects draw at pos + offset, so interpolation only needs to shift the offset
+            draw_pos = pos if alpha >= 1 else pygame.Vector2(i.prev_x, i.prev_y).lerp(pos, alpha)
+            offsets[i] = ((draw_pos - offset).rotate(angle)) * scale - pos + center
+        self.drawn_count, self.culled_count = len(offsets), culled
+
+    def render_pass(self, name, renderer: Renderer):
+        offsets = self._frame_offsets
+        scale, angle = self._frame_scale, self._frame_angle
+        layers = self._passes[name]
+        for z in self._layer_order:
+            for i, method in layers[z].items():
+                offset = offsets.get(i)
+                if offset is not None:
+                    method(renderer, offset, scale, angle)
+
+    def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0, passes=RENDER_PASSES):
+        self.begin_frame(renderer, offset, scale, angle)
+        for name in passes:
+            self.render_pass(name, renderer)
 
     def render_glow(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
-        offset += self.camera.get_offset()
-        scale *= self.camera.zoom
-        angle += self.camera.rotation
-        for i in self.objects:
-            pos = i.pos
-            if not i.first_render:
-                i.first_render = True
-                i.on_renderer_ready(renderer)
-            center = [Config.WIDTH / 2, Config.HEIGHT / 2]
-            i.render_glow(renderer, (((pos - offset).rotate(angle)) * scale) - pos + center, scale, angle)
+        self.render(renderer, offset, scale, angle, ('render_glow',))
 
     def render_overlay(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
-        offset += self.camera.get_offset()
-        scale *= self.camera.zoom
-        angle += self.camera.rotation
-        for i in self.objects:
-            pos = i.pos
-            if not i.first_render:
-                i.first_render = True
-                i.on_renderer_ready(renderer)
-            center = [Config.WIDTH / 2, Config.HEIGHT / 2]
-            i.render_overlay(renderer, (((pos - offset).rotate(angle)) * scale) - pos + center, scale, angle)
+        self.render(renderer, offset, scale, angle, ('render_overlay',))
@@ -5,7 +5,8 @@ from typing import Optional
 import pymunk
 
 from src.engine.config import *
-from src.engine.objects import BaseObject, BaseStructure, TimerObject
+from src.engine.objects import BaseObject, BaseStructure
+from src.engine.scheduler import ScheduledCallback
 from src.engine.utils import Timer, LoopingSpriteSheet
 from src.engine.video import Renderer
 
@@ -24,15 +25,13 @@ class PhysicsObject(BaseObject):
         self.width = right[0] - left[0]
         self.height = bottom[1] - top[1]
 
-        self.timer = TimerObject(timer, action=self.destroy, oneshot=True)
+        self.timer = ScheduledCallback(timer, self.destroy)
         self.color = color
 
         self.extra_shapes = []
 
     def on_ready(self):
-        self.object_manager.add(
-            self.timer
-        )
+        self.object_manager.scheduler.add(self.timer)
 
     def on_physics_ready(self, physics_manager: 'PhysicsManager'):
         physics_manager.add(self.body, self.shape, *self.extra_shapes)
@@ -47,8 +46,13 @@ class PhysicsObject(BaseObject):
 
     @property
     def pos(self):
-        self.x, self.y = self.body.position
-        return pygame.Vector2(*self.body.position)
+        x, y = self.body.position
+        if (x, y) != (self.x, self.y):
+            # the body moved in the physics step, synced here
+            self.x, self.y = x, y
+            if self.object_manager is not None:
+                self.object_manager.on_object_moved(self)
+        return pygame.Vector2(x, y)
 
     @pos.setter
     def pos(self, value):
@@ -61,6 +65,7 @@ class PhysicsObject(BaseObject):
 
     def destroy(self):
         super().destroy()
+        self.timer.cancel()
         self.unregister_from_physics_space()
 
     def unregister_from_physics_space(self):
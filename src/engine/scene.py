@@ -1,11 +1,16 @@
 import importlib
 import traceback
-from typing import Optional
+from collections import deque
+from typing import Iterator, Optional
 
+from src.engine.assets import AssetManifest
+from src.engine.cache import SURFACE_CACHE
 from src.engine.objects import *
 from src.engine.physics import PhysicsManager
 from src.engine.save import WASMFetch
+from src.engine.sounds import SoundManager
 from src.engine.subtitles import SubtitleManager, get_typed_subtitles
+from src.engine.template import clone
 from src.engine.transition import TransitionManager
 from src.engine.utils import *
 
@@ -121,8 +126,13 @@ class Scene(BaseStructure, metaclass=MetaClass):
     """
     Base signature for all menus
     """
+    render_passes = RENDER_PASSES  # object manager passes drawn each frame, in order
+    next_scenes: tuple[str, ...] = ()  # scenes likely entered from this one, preloaded during transitions
+    assets = ()  # object classes and paths for the asset manifest, prewarmed before the scene is shown
+    use_template = False  # reset restores a copy of the state captured when the scene finished building
 
     def __init__(self, manager: 'SceneManager', name='menu'):
+        self._template: Optional[dict] = None
         self.manager = manager
         self.name = name
         self.error: Optional[Exception] = None
@@ -139,6 +149,16 @@ class Scene(BaseStructure, metaclass=MetaClass):
     def get_menu_name():
         return 'none'
 
+    def get_manifest(self) -> AssetManifest:
+        return AssetManifest(*self.assets)
+
+    def build(self):
+        """
+        Construction that runs after __init__, as a generator yielding between chunks of work,
+        so a preloaded scene can be built over several ticks (see SceneManager.preload_step)
+        """
+        yield from ()
+
     def enter(self):
         pass
 
@@ -146,10 +166,10 @@ class Scene(BaseStructure, metaclass=MetaClass):
         pass
 
     def pause(self):
-        pass
+        self.object_manager.scheduler.pause()
 
     def resume(self):
-        pass
+        self.object_manager.scheduler.resume()
 
     def raise_error(self, exception: Exception):
         self.error = exception
@@ -157,9 +177,25 @@ class Scene(BaseStructure, metaclass=MetaClass):
         print(e)
         print(*traceback.format_exception(type(e), e, e.__traceback__))
 
+    def capture_template(self):
+        """
+        Snapshot the scene state so reset can restore it instead of running __init__ again.
+        SceneManager captures it once the scene is built, with its objects added and bound to the renderer
+        but before its first update, so a restored scene skips all of that.
+        """
+        state = {i: j for i, j in self.__dict__.items() if i != '_template'}
+        self._template = clone(state, {id(self): self, id(self.manager): self.manager})
+
+    def restore_template(self):
+        self.__dict__.update(clone(self._template, {id(self): self, id(self.manager): self.manager}))
+
     def reset(self):
         self.exit()
-        self.__init__(self.manager, self.name)
+        if self._template:
+            self.restore_template()
+        else:
+            self.__init__(self.manager, self.name)
+            run_steps(self.build())
         self.enter()
 
     def update(self, events: list[pygame.event.Event], dt):
@@ -172,7 +208,20 @@ class Scene(BaseStructure, metaclass=MetaClass):
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         if DEBUG:
             renderer.text(self.name, 50, 'white', [50, 50], 'topleft')
-        self.object_manager.render(renderer, offset, scale, angle)
+        self.object_manager.begin_frame(renderer, offset, scale, angle)
+        for name in self.render_passes:
+            self.object_manager.render_pass(name, renderer)
+        if DEBUG:
+            renderer.text(f'drawn {self.object_manager.drawn_count} culled {self.object_manager.culled_count}',
+                          Config.SMALL_TEXT, 'white', [50, 100], 'topleft')
+            renderer.text(f'pool hits {self.object_manager.pool_hits} misses {self.object_manager.pool_misses}',
+                          Config.SMALL_TEXT, 'white', [50, 100 + Config.SMALL_TEXT], 'topleft')
+            positional = SoundManager.positional
+            renderer.text(f'sounds played {positional["played"]} culled {positional["culled"]}',
+                          Config.SMALL_TEXT, 'white', [50, 100 + Config.SMALL_TEXT * 2], 'topleft')
+            cache = SURFACE_CACHE.get_stats()
+            renderer.text(f'surface cache {cache["bytes"] / 1024 ** 2:.1f} MB hit rate {cache["hit_rate"]:.2f}',
+                          Config.SMALL_TEXT, 'white', [50, 100 + Config.SMALL_TEXT * 3], 'topleft')
 
 
 class UnloadedScene(Scene):
@@ -183,7 +232,8 @@ class UnloadedScene(Scene):
 
 
 class SceneManager(BaseStructure):
-    def __init__(self):
+    def __init__(self, renderer: Renderer = None):
+        self.renderer = renderer  # binds templated scenes before they are captured, None leaves that to the first render
         self.to_switch = 'none'  # to-switch transition
         self.to_reset = False
         self.to_save_in_stack = True
@@ -208,13 +258,22 @@ class SceneManager(BaseStructure):
             except ImportError as e:
                 print(e)
                 print(f"Could not import scene {scene_name}")
+        print(*(i.__repr__() for i in self.menu_references), sep='\n')
+        # scenes are constructed from menu_references on first use
         self.menus: dict[str, Scene] = {}
-        for i, _ in self.menu_references.items():
-            self.menus[i] = self.menu_references.get(i)(self, i)
-        print(*(i.__repr__() for i in self.menus), sep='\n')
+        self.preload_queue: deque[str] = deque()
+        self._construction: tuple[str, Scene, Iterator] | None = None  # scene being preloaded and its build steps
+        self._unentered: set[str] = set()  # constructed but never entered, so a reset on entry is redundant
+        self.prewarmed: set[str] = set()  # scenes whose asset manifest is loaded
+        self.prewarm_progress = (0, 0)  # (loaded, total) of the manifest being prewarmed
+        self._prewarm = None
+        self._prewarm_mode = None
+        self.outgoing_captured = False  # the scene being left is rendered into SCREEN_TEX and no longer updated
         self.mode = Config.ROOT_SCENE
-        self.menu = self.menus[self.mode]
+        self.menu = self.get_menu(self.mode)
+        self._unentered.discard(self.mode)
         self.menu.enter()
+        self.preload(*self.menu.next_scenes)
         self.mode_stack = []  # for stack based scene rendering
         self._default_reset = False
         self._default_transition = False
@@ -223,7 +282,74 @@ class SceneManager(BaseStructure):
         try:
             return self.menus[menu]
         except KeyError:
-            return UnloadedScene(self, 'Error')
+            pass
+        if self._construction is not None and self._construction[0] == menu:
+            # needed before its preload finished, build the rest now
+            _, scene, steps = self._construction
+            self._construction = None
+        else:
+            try:
+                factory = self.menu_references[menu]
+            except KeyError:
+                return UnloadedScene(self, 'Error')
+            scene = factory(self, menu)
+            steps = self.build_steps(menu, scene)
+        run_steps(steps)
+        self.menus[menu] = scene
+        self._unentered.add(menu)
+        return scene
+
+    def build_steps(self, menu, scene: Scene):
+        """
+        The scene's build steps, followed (if it uses a template) by adding its objects, binding them to
+        the renderer and capturing the template, all before its first update
+        """
+        yield from scene.build()
+        if not scene.use_template:
+            return
+        scene.object_manager.flush()
+        if self.renderer is not None:
+            yield
+            yield from self.renderer.prewarm(scene.get_manifest())
+            self.prewarmed.add(menu)
+            scene.object_manager.prepare_renderer(self.renderer)
+        yield
+        scene.capture_template()
+
+    def preload(self, *menus, first=False):
+        """Queue scenes to be constructed ahead of time, a few build steps per tick while a transition is closing"""
+        if not Config.PRELOAD_SCENES:
+            return
+        for menu in reversed(menus) if first else menus:
+            if menu in self.menus or menu not in self.menu_references:
+                continue
+            if menu in self.preload_queue:
+                self.preload_queue.remove(menu)
+            if first:
+                self.preload_queue.appendleft(menu)
+            else:
+                self.preload_queue.append(menu)
+
+    def preload_step(self, budget=Config.PRELOAD_BUDGET):
+        """Continue constructing the queued scenes, spending at most about budget seconds"""
+        start = time.perf_counter()
+        while self._construction is not None or self.preload_queue:
+            if self._construction is None:
+                menu = self.preload_queue.popleft()
+                if menu in self.menus:
+                    continue
+                scene = self.menu_references[menu](self, menu)
+                self._construction = menu, scene, self.build_steps(menu, scene)
+            else:
+                menu, scene, steps = self._construction
+                for _ in steps:
+                    if time.perf_counter() - start >= budget:
+                        return
+                self._construction = None
+                self.menus[menu] = scene
+                self._unentered.add(menu)
+            if time.perf_counter() - start >= budget:
+                return
 
     def switch_to_prev_mode(self, reset=None, transition=False):
         if not reset:
@@ -236,21 +362,25 @@ class SceneManager(BaseStructure):
             sys.exit(0)
 
     def switch_mode(self, mode, reset=False, transition=False, save_in_stack=False):
-        if mode in self.menus:
+        if mode in self.menu_references:
             if transition:
                 self.to_switch = mode
                 self.to_reset = reset
                 self.to_save_in_stack = save_in_stack
+                self.preload(mode, first=True)
                 self.transition_manager.close()
             else:
                 if save_in_stack:
                     self.mode_stack.append(self.mode)
                 self.mode = mode
                 self.menu.exit()
-                self.menu = self.menus[self.mode]
+                self.menu = self.get_menu(self.mode)
+                fresh = self.mode in self._unentered
+                self._unentered.discard(self.mode)
                 self.menu.enter()
-                if reset:
+                if reset and not fresh:
                     self.menu.reset()
+                self.preload(*self.menu.next_scenes)
                 self.subtitle_manager.clear()
 
     def update(self, events: list[pygame.event.Event], dt):
@@ -259,8 +389,12 @@ class SceneManager(BaseStructure):
                 self.switch_mode(self.to_switch, self.to_reset, transition=False, save_in_stack=self.to_save_in_stack)
                 self.to_switch = 'none'
                 self.to_reset = False
+                self.outgoing_captured = False
                 self.transition_manager.open()
-        self.menu.update(events, dt)
+            else:
+                self.preload_step()
+        if not self.outgoing_captured:
+            self.menu.update(events, dt)
         self.transition_manager.update(events, dt)
         self.subtitle_manager.update(events, dt)
         for e in events:
@@ -288,7 +422,42 @@ class SceneManager(BaseStructure):
         self.transition_manager.draw(surf, offset)
         self.subtitle_manager.draw(surf, offset)
 
+    def prewarm(self, renderer: Renderer, mode, budget=None):
+        """Load the assets of a scene's manifest, spending at most budget seconds (everything when None)"""
+        if self._prewarm_mode != mode:
+            self._prewarm_mode = mode
+            self._prewarm = renderer.prewarm(self.get_menu(mode).get_manifest())
+            self.prewarm_progress = (0, 0)
+        start = time.perf_counter()
+        for self.prewarm_progress in self._prewarm:
+            if budget is not None and time.perf_counter() - start >= budget:
+                return
+        self.prewarmed.add(mode)
+        self._prewarm = self._prewarm_mode = None
+
+    def render_outgoing(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
+        # the scene is rendered once into SCREEN_TEX when the transition starts, then shown from there
+        screen = renderer.textures[Renderer.TEXTURES.SCREEN_TEX]
+        if not self.outgoing_captured:
+            renderer.target = screen
+            renderer.draw_color = pygame.Color('black')
+            renderer.clear()
+            self.menu.render(renderer, offset, scale, angle)
+            renderer.target = None
+            self.outgoing_captured = True
+        screen.draw(None, Config.SCREEN_RECT)
+
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
-        self.menu.render(renderer, offset, scale, angle)
+        if self.mode not in self.prewarmed:
+            self.prewarm(renderer, self.mode)  # shown before its assets were ready, load the rest at once
+        elif self.to_switch in self.menus and self.to_switch not in self.prewarmed:
+            self.prewarm(renderer, self.to_switch, Config.PREWARM_BUDGET)
+        if self.to_switch != 'none' and Config.CAPTURE_OUTGOING_SCENE:
+            self.render_outgoing(renderer, offset, scale, angle)
+        else:
+            self.menu.render(renderer, offset, scale, angle)
         self.transition_manager.render(renderer, offset, scale, angle)
         self.subtitle_manager.render(renderer, offset, scale, angle)
+        if DEBUG and self._prewarm is not None:
+            renderer.text(f'loading {self._prewarm_mode} {self.prewarm_progress[0]}/{self.prewarm_progress[1]}',
+                          Config.SMALL_TEXT, 'white', [50, Config.HEIGHT - 50], 'topleft')
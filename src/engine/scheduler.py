@@ -0,0 +1,89 @@
+import heapq
+from itertools import count
+
+from src.engine.config import *
+
+
+class ScheduledCallback:
+    """
+    Handle for a callback run by a Scheduler after interval seconds of game time.
+    interval may be changed at any time (even from the callback), it applies the next time the handle is scheduled.
+    """
+
+    def __init__(self, interval, callback, repeat=False):
+        self.interval = interval
+        self.callback = callback
+        self.repeat = repeat
+        self.scheduler: Scheduler | None = None
+        self.due = None
+        self.active = False
+        self._version = 0  # bumped on every (re)schedule and cancel so stale heap entries are skipped
+
+    def cancel(self):
+        self.active = False
+        self._version += 1
+
+    def reset(self):
+        # restart the countdown from the current game time
+        if self.scheduler is not None:
+            self.scheduler.add(self)
+
+
+class Scheduler:
+    """
+    Heap of callbacks keyed on game time.
+    Game time follows the dt passed to update (so Config.TIME_SCALE applies) and stops while paused.
+    The cost of a tick depends on the callbacks that fire, not on how many are scheduled.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.paused = False
+        self._heap = []
+        self._counter = count()  # tie-breaker, keeps callbacks with the same due time in scheduling order
+
+    def __len__(self):
+        return len(self._heap)
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def schedule(self, delay, callback, repeat=False) -> ScheduledCallback:
+        handle = ScheduledCallback(delay, callback, repeat)
+        self.add(handle)
+        return handle
+
+    def add(self, handle: ScheduledCallback, due=None):
+        handle.scheduler = self
+        handle._version += 1
+        if handle.interval == 'inf':
+            handle.active = False
+            return
+        handle.active = True
+        handle.due = self.time + float(handle.interval) if due is None else due
+        heapq.heappush(self._heap, (handle.due, next(self._counter), handle._version, handle))
+
+    def clear(self):
+        for *_, handle in self._heap:
+            handle.active = False
+        self._heap.clear()
+
+    def update(self, dt):
+        if self.paused:
+            return
+        self.time += dt / Config.TARGET_FPS
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            due, _, version, handle = heapq.heappop(heap)
+            if version != handle._version:
+                continue  # cancelled or rescheduled since this entry was pushed
+            if not handle.repeat:
+                handle.active = False
+            handle.callback()
+            if handle.repeat and handle.active and version == handle._version:
+                # due + interval keeps the cadence (and catches up) when several intervals pass in one tick
+                interval = float(handle.interval)
+                self.add(handle, due + interval if interval > 0 else self.time + 1 / Config.TICK_RATE)
@@ -1,7 +1,129 @@
+import hashlib
+import math
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple
+
 import pygame.mixer
 
 from src.engine.config import *
-from src.engine.utils import get_path, Timer
+from src.engine.utils import clamp, get_cache_path, get_path, Timer
+
+
+class SoundPolicy(NamedTuple):
+    max_voices: int = 4  # instances of the sound playing at once, the oldest is restarted past this
+    min_interval: float = 0.0  # seconds before the sound can start again, plays inside it are dropped
+    priority: int = 0  # may take the channel of a sound with the same or lower priority when none is free
+    queue: bool = False  # played once loaded if played while still loading, otherwise skipped
+
+
+PCM_HEADER = struct.Struct('<4sQ')  # magic and sample byte count, a truncated cache file fails the check
+PCM_MAGIC = b'PCM1'
+
+
+def read_pcm(path):
+    data = path.read_bytes()
+    if len(data) < PCM_HEADER.size:
+        raise ValueError(f'{path} is truncated')
+    magic, length = PCM_HEADER.unpack_from(data)
+    if magic != PCM_MAGIC or length != len(data) - PCM_HEADER.size:
+        raise ValueError(f'{path} is truncated or not a decoded sound')
+    return data[PCM_HEADER.size:]
+
+
+def write_pcm(path, raw: bytes):
+    # written next to the target and renamed over it, so a crash never leaves a partial file behind
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(PCM_HEADER.pack(PCM_MAGIC, len(raw)))
+            f.write(raw)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def load_pcm(path):
+    """
+    Sound for the file at path, built from decoded PCM cached in .cache/sounds
+    (keyed by the file's hash and the mixer format, the samples are stored already converted to it).
+    Returns the sound and whether the cache was hit. Safe to run on a worker thread.
+    """
+    data = path.read_bytes()
+    digest = hashlib.sha1(data)
+    digest.update(repr(pygame.mixer.get_init()).encode())
+    cache = get_cache_path('sounds', f'{digest.hexdigest()[:16]}.pcm')
+    try:
+        return pygame.mixer.Sound(buffer=read_pcm(cache)), True
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f'ignoring decoded cache for {path}: {e}')
+    sound = pygame.mixer.Sound(file=path)
+    try:
+        write_pcm(cache, sound.get_raw())
+    except OSError:
+        pass
+    return sound, False
+
+
+class Voice:
+    def __init__(self, channel: pygame.mixer.Channel):
+        self.channel = channel
+        self.sound = None
+        self.priority = 0
+        self.started = 0.0
+
+
+class VoicePool:
+    """
+    Hands out a fixed set of mixer channels to sounds.
+    Each sound has its own concurrency cap and retrigger interval (SoundPolicy), so a burst of plays
+    (a smartbomb destroying half the station) costs a bounded number of voices instead of every free channel.
+    """
+
+    def __init__(self, channels: list[pygame.mixer.Channel]):
+        self.voices = [Voice(i) for i in channels]
+        self.last_started: dict[str, float] = {}
+        self.stats = {'played': 0, 'throttled': 0, 'stolen': 0, 'dropped': 0}
+
+    def acquire(self, sound, policy: SoundPolicy) -> Voice | None:
+        now = time.perf_counter()
+        if now - self.last_started.get(sound, -math.inf) < policy.min_interval:
+            self.stats['throttled'] += 1
+            return None
+        free = None
+        same = []
+        for voice in self.voices:
+            if not voice.channel.get_busy():
+                voice.sound = None
+                if free is None:
+                    free = voice
+            elif voice.sound == sound:
+                same.append(voice)
+        if len(same) >= policy.max_voices:
+            voice = min(same, key=lambda i: i.started)  # restart the oldest instance
+            self.stats['stolen'] += 1
+        elif free is not None:
+            voice = free
+        else:
+            candidates = [i for i in self.voices if i.priority <= policy.priority]
+            if not candidates:
+                self.stats['dropped'] += 1
+                return None
+            voice = min(candidates, key=lambda i: (i.priority, i.started))
+            self.stats['stolen'] += 1
+        voice.sound = sound
+        voice.priority = policy.priority
+        voice.started = now
+        self.last_started[sound] = now
+        self.stats['played'] += 1
+        return voice
 
 
 class SoundManager:
@@ -27,7 +149,26 @@ class SoundManager:
     # for i in range(1, 11):
     #     sounds[f'slime{i}'] = f'slime{i}.wav'
 
+    # sounds without an entry use the SoundPolicy defaults
+    policies = {
+        'shoot': SoundPolicy(max_voices=3, min_interval=0.05, priority=2),
+        'contract_message': SoundPolicy(max_voices=1, priority=5, queue=True),
+        'notification': SoundPolicy(max_voices=1, priority=4, queue=True),
+        'popup': SoundPolicy(max_voices=2, priority=4, queue=True),
+        'explosion': SoundPolicy(max_voices=6, min_interval=0.03, priority=1),
+        'spark': SoundPolicy(max_voices=4, min_interval=0.03, priority=0),
+    }
+
     sound_objects: dict[str, pygame.mixer.Sound] = {}
+    voices: VoicePool | None = None
+    # background loading
+    loader: ThreadPoolExecutor | None = None
+    loading: dict[str, Future] = {}
+    unavailable: set[str] = set()  # failed to load, plays are skipped
+    queued: list[tuple[str, int, int]] = []  # (sound, loops, volume) played while loading
+    positional = {'played': 0, 'culled': 0}  # play_at calls heard / skipped for being out of earshot
+    cache_hits = 0
+    load_started = 0.0
     bg_sound = 'bg.wav'
     home_page_sound = ''
 
@@ -45,7 +186,46 @@ class SoundManager:
 
     @classmethod
     def update(cls):
-        pass
+        if cls.loading:
+            cls._collect_loaded()
+
+    @classmethod
+    def _collect_loaded(cls):
+        for name, future in list(cls.loading.items()):
+            if future.done():
+                del cls.loading[name]
+                try:
+                    cls._add_sound(name, *future.result())
+                except Exception as e:
+                    cls._on_load_failed(name, e)
+        if not cls.loading:
+            cls._report_loaded()
+            if cls.loader is not None:
+                cls.loader.shutdown(wait=False)
+                cls.loader = None
+        queued, cls.queued = cls.queued, []
+        for sound, loops, volume in queued:
+            cls.play(sound, loops, volume=volume)
+
+    @classmethod
+    def _report_loaded(cls):
+        print(f'sounds loaded in {time.perf_counter() - cls.load_started:.3f}s '
+              f'({cls.cache_hits}/{len(cls.sound_objects)} from the decoded cache)')
+
+    @classmethod
+    def _on_load_failed(cls, name, error):
+        print(f'could not load sound {name} ({cls.sounds[name]}): {error!r}, it will not play')
+        cls.unavailable.add(name)
+
+    @classmethod
+    def _add_sound(cls, name, sound: pygame.mixer.Sound, cache_hit):
+        sound.set_volume(1)  # shared between voices, the volume is set per channel
+        cls.sound_objects[name] = sound
+        cls.cache_hits += cache_hit
+
+    @classmethod
+    def is_ready(cls, sound):
+        return sound in cls.sound_objects
 
     @classmethod
     def set_fadeout(cls, time):
@@ -57,34 +237,76 @@ class SoundManager:
 
     @classmethod
     def load_sounds(cls):
-        for i, j in cls.sounds.items():
-            print('loading... ', i, get_path('sounds', j))
-            cls.sound_objects[i] = pygame.mixer.Sound(
-                get_path('sounds', j).__str__())
-        for i in cls.sound_objects:
-            cls.sound_objects[i].set_volume(cls._get_volume())
+        """Starts decoding every sound on a thread pool, they become playable as update collects them"""
+        cls.load_started = time.perf_counter()
+        if Config.PLATFORM_WEB:
+            # no threads in the browser
+            for i, j in cls.sounds.items():
+                try:
+                    cls._add_sound(i, *load_pcm(get_path('sounds', j)))
+                except Exception as e:
+                    cls._on_load_failed(i, e)
+            cls._report_loaded()
+        else:
+            cls.loader = ThreadPoolExecutor(Config.SOUND_LOADER_THREADS, thread_name_prefix='sounds')
+            for i, j in cls.sounds.items():
+                print('loading... ', i, get_path('sounds', j))
+                cls.loading[i] = cls.loader.submit(load_pcm, get_path('sounds', j))
         cls.bg_music.set_volume(cls._get_volume())
         pygame.mixer.set_reserved(1)
         cls.bg_channel = pygame.mixer.Channel(0)
+        cls.voices = VoicePool([pygame.mixer.Channel(i) for i in range(1, pygame.mixer.get_num_channels())])
 
     @classmethod
     def play(cls, sound, loops=0, preload=True, volume=100, end_event=None):
         if GAMESTATS.SPEAKERS_INIT:
-            if preload:
-                if sound in cls.sounds:
-                    cls.sound_objects[sound].set_volume(volume / 100)
-                    channel = cls.sound_objects[sound].play(loops)
-                    # channel.set_endevent(end_event if end_event else EVENTS.SONG_FINISHED_EVENT)
-            else:
-                if sound in cls.sounds:
-                    s = pygame.mixer.Sound(get_path('sounds', cls.sounds[sound]))
-                    s.set_volume(volume / 100)
-                    s.play(loops)
+            # every sound is loaded in the background at startup, preload only remains for callers
+            if sound not in cls.sounds:
+                return
+            policy = cls.policies.get(sound, SoundPolicy())
+            if sound not in cls.sound_objects:
+                if policy.queue and sound in cls.loading:
+                    cls.queued.append((sound, loops, volume))
+                return
+            cls._start(sound, policy, loops, volume / 100)
+
+    @classmethod
+    def _start(cls, sound, policy: SoundPolicy, loops, left, right=None):
+        voice = cls.voices.acquire(sound, policy)
+        if voice is None:
+            return
+        voice.channel.play(cls.sound_objects[sound], loops)
+        if right is None:
+            voice.channel.set_volume(left)
+        else:
+            voice.channel.set_volume(left, right)
+        # voice.channel.set_endevent(end_event if end_event else EVENTS.SONG_FINISHED_EVENT)
+
+    @classmethod
+    def play_at(cls, sound, pos, camera, loops=0, volume=100):
+        """
+        Plays a sound coming from a world position: quieter the further it is from the camera centre on screen
+        (so zooming out brings more of the world into earshot) and panned towards its side.
+        Sounds below Config.AUDIO_CUTOFF are skipped without touching the mixer.
+        """
+        if not GAMESTATS.SPEAKERS_INIT or sound not in cls.sound_objects:
+            return
+        half_width = Config.WIDTH / 2
+        relative = camera.world_to_screen(pos) - Config.center()
+        near, far = Config.AUDIO_RANGE
+        gain = clamp(1 - (relative.length() / half_width - near) / (far - near), 0, 1) * volume / 100
+        if gain < Config.AUDIO_CUTOFF:
+            cls.positional['culled'] += 1
+            return
+        cls.positional['played'] += 1
+        pan = clamp(relative.x / half_width, -1, 1)
+        cls._start(sound, cls.policies.get(sound, SoundPolicy()), loops, gain * min(1, 1 - pan), gain * min(1, 1 + pan))
 
     @classmethod
     def stop(cls, sound, fadeout=100):
         if GAMESTATS.SPEAKERS_INIT:
-            if sound in cls.sounds:
+            cls.queued = [i for i in cls.queued if i[0] != sound]
+            if sound in cls.sound_objects:
                 cls.sound_objects[sound].fadeout(fadeout)
 
     @classmethod
@@ -1,8 +1,11 @@
+from collections import deque
+
 import pygame
 
 from src.engine.objects import BaseStructure
 from src.engine.sounds import SoundManager
-from src.engine.utils import Timer, text
+from src.engine.utils import Timer, font, text
+from src.engine.video import Renderer
 from src.engine.config import *
 from typing import Union
 
@@ -14,8 +17,13 @@ class Subtitle(BaseStructure):
         self.done = False
         self.pos = pos
         self.callback = callback
+        self.name, self.size, self.color = name, size, color
         self.text = text(name, size, color)
 
+    def start(self):
+        # called when the subtitle comes up in the queue
+        self.timer.reset()
+
     def update(self, events: list[pygame.event.Event], dt):
         if self.timer.tick:
             if self._time != 'inf':
@@ -30,6 +38,64 @@ class Subtitle(BaseStructure):
         pygame.draw.rect(surf, 'black', rect1, 2)
         surf.blit(self.text, rect)
 
+    def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
+        rect = self.text.get_rect(center=self.pos).inflate(20, 20)
+        renderer.rect('#511309', rect)
+        renderer.rect('black', rect, 2)
+        renderer.text(self.name, self.size, self.color, self.pos)
+
+
+class TypedSubtitle(Subtitle):
+    """
+    Line typed out one character every char_time seconds of game time, then held for time seconds.
+    The line is rasterized once; draw clips it to the typed prefix (render draws the prefix from the glyph atlas).
+    The callback runs when the last character appears.
+    """
+
+    def __init__(self, name, time=2, char_time=0.05, size=35, pos=(Config.WIDTH // 2, Config.HEIGHT // 2),
+                 color='white', callback=None):
+        super().__init__(name, time, size, pos, color, callback)
+        self.char_time = char_time
+        self.elapsed = 0.0
+        self.count = min(1, len(name))  # characters typed so far
+        # width of every prefix, for clipping (measuring doesn't rasterize)
+        self.widths = [font(size).size(name[:i])[0] for i in range(len(name) + 1)]
+
+    def start(self):
+        super().start()
+        self.elapsed = 0.0
+        self.count = min(1, len(self.name))
+
+    def update(self, events: list[pygame.event.Event], dt):
+        self.elapsed += dt / Config.TARGET_FPS
+        count = min(len(self.name), 1 + int(self.elapsed / self.char_time))
+        if count != self.count:
+            self.count = count
+            SoundManager.play('click')
+            if count == len(self.name) and self.callback is not None:
+                self.callback()
+        if self._time != 'inf' and self.count == len(self.name):
+            if self.elapsed >= (len(self.name) - 1) * self.char_time + self.timer.timeout:
+                self.done = True
+
+    def draw(self, surf: pygame.Surface, offset, scale=1.0, angle=0.0):
+        area = pygame.Rect(0, 0, self.widths[self.count], self.text.get_height())
+        rect = area.copy()
+        rect.center = self.pos
+        rect1 = rect.inflate(20, 20)
+        pygame.draw.rect(surf, '#511309', rect1)
+        pygame.draw.rect(surf, 'black', rect1, 2)
+        surf.blit(self.text, rect, area)
+
+    def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
+        rect = pygame.Rect(0, 0, self.widths[self.count], self.text.get_height())
+        rect.center = self.pos
+        rect1 = rect.inflate(20, 20)
+        renderer.rect('#511309', rect1)
+        renderer.rect('black', rect1, 2)
+        # a growing prefix only lays out the new glyphs (see Renderer.get_glyph_run)
+        renderer.text(self.name[:self.count], self.size, self.color, self.pos)
+
 
 class BlinkingSubtitle(Subtitle):
     def __init__(self, name, time=None, size=35, pos=(Config.WIDTH // 2, Config.HEIGHT // 2), color='white', callback=None, blink_timer=0.5):
@@ -56,21 +122,16 @@ class BlinkingSubtitle(Subtitle):
 def get_typed_subtitles(_text, _time=2, _time_diff=0.05, pos=None, callback=None):
     if pos is None:
         pos = (Config.WIDTH // 2, Config.HEIGHT // 2)
-    subtitles = []
-    for i in range(1, len(_text) - 2):
-        subtitles.append(Subtitle(_text[0:i], _time_diff, pos=pos))
-    subtitles.append(Subtitle(_text[0:-1], _time_diff, pos=pos, callback=callback))
-    subtitles.append(Subtitle(_text, _time, pos=pos))
-    return subtitles
+    return [TypedSubtitle(_text, _time, _time_diff, pos=pos, callback=callback)]
 
 
 class SubtitleManager(BaseStructure):
     def __init__(self):
-        self.subtitles = [
+        self.subtitles: deque[Subtitle] = deque([
             # Subtitle('yo', 1),
             # Subtitle('wassup', 1),
             # *get_typed_subtitles('this is a typed text')
-        ]
+        ])
         self.current_subtitle: Union[Subtitle, None] = None
 
     def clear(self):
@@ -92,8 +153,8 @@ class SubtitleManager(BaseStructure):
                 if self.current_subtitle.done:
                     self.current_subtitle = None
                     try:
-                        self.current_subtitle = self.subtitles.pop(0)
-                        self.current_subtitle.timer.reset()
+                        self.current_subtitle = self.subtitles.popleft()
+                        self.current_subtitle.start()
                         if type(self.current_subtitle) == Subtitle:
                             SoundManager.play('click')
                     except IndexError:
@@ -102,11 +163,15 @@ class SubtitleManager(BaseStructure):
                 print(e)
         else:
             try:
-                self.current_subtitle = self.subtitles.pop(0)
-                self.current_subtitle.timer.reset()
+                self.current_subtitle = self.subtitles.popleft()
+                self.current_subtitle.start()
             except IndexError:
                 pass
 
     def draw(self, surf: pygame.Surface, offset, scale=1.0, angle=0.0):
         if self.current_subtitle:
             self.current_subtitle.draw(surf, offset)
+
+    def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
+        if self.current_subtitle:
+            self.current_subtitle.render(renderer, offset)
@@ -0,0 +1,134 @@
+import copy
+import types
+from collections import deque
+
+import pygame
+from pygame._sdl2 import video as sdl2_video
+
+from src.engine.config import *
+from src.engine.video import Texture, Image, HeadlessImage, HeadlessTexture
+
+# shared between a template and its clones: immutable, or GPU resources bound once and reused
+_SHARED = {
+    int, float, complex, bool, str, bytes, range, type(None), type, types.BuiltinFunctionType,
+    pygame.Surface, sdl2_video.Texture, sdl2_video.Image, Texture, Image, HeadlessTexture, HeadlessImage,
+}
+
+
+def _clone_list(obj, memo):
+    new = memo[id(obj)] = []
+    new.extend(i if type(i) in _SHARED else clone(i, memo) for i in obj)
+    return new
+
+
+def _clone_dict(obj, memo):
+    new = memo[id(obj)] = {}
+    for key, value in obj.items():
+        if type(key) not in _SHARED:
+            key = clone(key, memo)
+        new[key] = value if type(value) in _SHARED else clone(value, memo)
+    return new
+
+
+def _clone_set(obj, memo):
+    new = memo[id(obj)] = set()
+    new.update(clone(i, memo) for i in obj)
+    return new
+
+
+def _clone_deque(obj, memo):
+    new = memo[id(obj)] = deque(maxlen=obj.maxlen)
+    new.extend(clone(i, memo) for i in obj)
+    return new
+
+
+def _clone_tuple(obj, memo):
+    return tuple(i if type(i) in _SHARED else clone(i, memo) for i in obj)
+
+
+def _clone_method(obj, memo):
+    return types.MethodType(obj.__func__, clone(obj.__self__, memo))
+
+
+def _clone_cell(cell, memo):
+    # cells are shared by every closure over the same variable, so they go through the memo too
+    try:
+        return memo[id(cell)]
+    except KeyError:
+        pass
+    try:
+        contents = cell.cell_contents
+    except ValueError:
+        new = types.CellType()  # not assigned yet
+    else:
+        new = types.CellType(contents if type(contents) in _SHARED else clone(contents, memo))
+    memo[id(cell)] = new
+    return new
+
+
+def _clone_function(obj, memo):
+    # plain functions are shared, closures (and defaults) are rebound to the copies of what they captured
+    if obj.__closure__ is None and not obj.__defaults__ and not obj.__kwdefaults__:
+        return obj
+    new = types.FunctionType(
+        obj.__code__, obj.__globals__, obj.__name__,
+        _clone_tuple(obj.__defaults__, memo) if obj.__defaults__ else obj.__defaults__,
+        tuple(_clone_cell(i, memo) for i in obj.__closure__) if obj.__closure__ else None,
+    )
+    new.__qualname__ = obj.__qualname__
+    new.__kwdefaults__ = _clone_dict(obj.__kwdefaults__, memo) if obj.__kwdefaults__ else obj.__kwdefaults__
+    new.__dict__.update(obj.__dict__)
+    return new
+
+
+def _clone_copyable(obj, memo):
+    # value types with a cheap copy
+    return obj.copy()
+
+
+_DISPATCH = {
+    list: _clone_list,
+    dict: _clone_dict,
+    set: _clone_set,
+    deque: _clone_deque,
+    tuple: _clone_tuple,
+    types.MethodType: _clone_method,
+    types.FunctionType: _clone_function,
+    pygame.Vector2: _clone_copyable,
+    pygame.Vector3: _clone_copyable,
+    pygame.Rect: _clone_copyable,
+    pygame.FRect: _clone_copyable,
+}
+if NUMPY:
+    _DISPATCH[numpy.ndarray] = _clone_copyable
+
+
+def clone(obj, memo: dict):
+    """
+    Structured deep copy used for scene templates.
+    Game objects (classes from src) are copied attribute by attribute, containers and value types through a
+    type table, and textures / images / surfaces are shared. Anything else falls back to copy.deepcopy with
+    the same memo, so references between the two stay consistent (pymunk bodies and their space).
+    Plain functions are shared; lambdas and closures are rebuilt with their captured variables cloned,
+    so a callback capturing a game object calls into that object's copy.
+    """
+    try:
+        return memo[id(obj)]
+    except KeyError:
+        pass
+    cls = type(obj)
+    if cls in _SHARED:
+        return obj
+    copier = _DISPATCH.get(cls)
+    if copier is not None:
+        new = copier(obj, memo)
+    elif cls.__module__.startswith('src.') and hasattr(obj, '__dict__'):
+        new = memo[id(obj)] = cls.__new__(cls)
+        # most attributes are numbers, strings or None, skip the call for those
+        new.__dict__.update({
+            key: value if type(value) in _SHARED else clone(value, memo) for key, value in obj.__dict__.items()
+        })
+    else:
+        new = copy.deepcopy(obj, memo)
+    memo[id(obj)] = new
+    return new
@@ -1,7 +1,10 @@
+import math
+
+from src.engine.atlas import pack
 from src.engine.config import *
 from src.engine.objects import BaseStructure
 from src.engine.utils import clamp
-from src.engine.video import Renderer
+from src.engine.video import Renderer, Texture
 
 
 class Transition(BaseStructure):
@@ -46,82 +49,103 @@ class Transition(BaseStructure):
         surf.blit(self.surf, (0, 0))
 
 
-class SquareTransition(Transition):
+class GridTransition(Transition):
+    """
+    Grid of cells growing from 0 to size while closing and shrinking back while opening.
+    The cell sizes live in one array stepped in a single operation.
+    Rendering copies a pre-baked pattern per cell, one slot per whole-pixel size, all from one texture,
+    so the copies go out back to back and SDL batches them.
+    """
+
     def __init__(self):
         super().__init__()
         self.size = 50
-        self.multiplier = 5
-        self.squares = [
-            [0 for _ in range(Config.WIDTH // self.size + 1)] for _ in range(Config.HEIGHT // self.size + 1)
-        ]
+        rows, cols = Config.HEIGHT // self.size + 1, Config.WIDTH // self.size + 1
+        if NUMPY:
+            self.cells = numpy.zeros((rows, cols))
+        else:
+            self.cells = [[0.0] * cols for _ in range(rows)]
+        # top left of every cell, in the row-major order the cells are drawn in
+        self.origins = [(col * self.size, row * self.size) for row in range(rows) for col in range(cols)]
+        self._patterns = None
 
     def get_size(self) -> int:
-        return self.squares[0][0]
+        return self.cells[0][0]
 
     def update(self, events: list[pygame.event.Event], dt):
-        for row in range(len(self.squares)):
-            for col in range(len(self.squares[row])):
-                self.squares[row][col] += self.k * dt
-                # print(self.k)
-                if self.squares[row][col] > self.size:
-                    self.squares[row][col] = self.size
-                if self.squares[row][col] < 0:
-                    self.squares[row][col] = 0
+        if NUMPY:
+            self.cells += self.k * dt
+            numpy.clip(self.cells, 0, self.size, out=self.cells)
+        else:
+            self.cells = [[clamp(i + self.k * dt, 0, self.size) for i in row] for row in self.cells]
 
-    def draw(self, surf: pygame.Surface, offset, scale=1.0, angle=0.0):
-        for row in range(len(self.squares)):
-            for col in range(len(self.squares[row])):
-                size = self.squares[row][col]
-                if not size:
-                    continue
-                pygame.draw.rect(surf, 'black', [
-                    col * self.size + self.size // 2 - size // 2, row * self.size + self.size // 2 - size // 2, size,
-                    size])
-                pygame.draw.rect(surf, 'white', [
-                    col * self.size + self.size // 2 - size // 2, row * self.size + self.size // 2 - size // 2, size,
-                    size], 2)
+    def get_pattern(self, size: int) -> tuple[pygame.Surface, int, int]:
+        # pattern of a cell at this size and the offset of its top left from the cell's top left
+        raise NotImplementedError('get_pattern method not implemented yet')
+
+    def bake_patterns(self, renderer: Renderer):
+        patterns = {i: self.get_pattern(i) for i in range(1, self.size + 1)}
+        page, rects = pack({i: j[0] for i, j in patterns.items()})
+        texture = Texture.from_surface(renderer, page)
+        texture.blend_mode = pygame.BLENDMODE_BLEND
+        slots = [None] + [(rects[i], *patterns[i][1:]) for i in range(1, self.size + 1)]
+        return texture, slots
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
-        for row in range(len(self.squares)):
-            for col in range(len(self.squares[row])):
-                size = self.squares[row][col]
-                if not size:
-                    continue
-                renderer.rect('black', (
-                    col * self.size + self.size // 2 - size // 2, row * self.size + self.size // 2 - size // 2, size,
-                    size))
-                renderer.rect('white', (
-                    col * self.size + self.size // 2 - size // 2, row * self.size + self.size // 2 - size // 2, size,
-                    size), 2)
-
-
-class CircleTransition(Transition):
+        if self._patterns is None:
+            self._patterns = self.bake_patterns(renderer)
+        texture, slots = self._patterns
+        if NUMPY:
+            sizes = self.cells.astype(int).ravel().tolist()
+        else:
+            sizes = [int(i) for row in self.cells for i in row]
+        draw = texture.draw
+        for (x, y), size in zip(self.origins, sizes):
+            if size:
+                src, dx, dy = slots[size]
+                draw(src, (x + dx, y + dy, src.w, src.h))
+
+
+class SquareTransition(GridTransition):
     def __init__(self):
         super().__init__()
-        self.size = 50
-        self.multiplier = 2.5
-        self.circles = [
-            [0 for _ in range(Config.WIDTH // self.size + 1)] for _ in range(Config.HEIGHT // self.size + 1)
-        ]
+        self.multiplier = 5
 
-    def get_size(self) -> int:
-        return self.circles[0][0]
+    def get_pattern(self, size):
+        # what renderer.rect draws for a filled square plus a 2px outline centred on its edges
+        surf = pygame.Surface((size + 2, size + 2), pygame.SRCALPHA)
+        surf.fill('black', (1, 1, size, size))
+        for rect in [(1, 0, size, 2), (1, size, size, 2), (0, 1, 2, size), (size, 1, 2, size)]:
+            surf.fill('white', rect)
+        offset = self.size // 2 - size // 2 - 1
+        return surf, offset, offset
 
-    def update(self, events: list[pygame.event.Event], dt):
-        for row in range(len(self.circles)):
-            for col in range(len(self.circles[row])):
-                self.circles[row][col] += self.k * dt
-                if self.circles[row][col] > self.size:
-                    self.circles[row][col] = self.size
-                if self.circles[row][col] < 0:
-                    self.circles[row][col] = 0
+    def draw(self, surf: pygame.Surface, offset, scale=1.0, angle=0.0):
+        for (x, y), size in zip(self.origins, (i for row in self.cells for i in row)):
+            if not size:
+                continue
+            rect = [x + self.size // 2 - size // 2, y + self.size // 2 - size // 2, size, size]
+            pygame.draw.rect(surf, 'black', rect)
+            pygame.draw.rect(surf, 'white', rect, 2)
+
+
+class CircleTransition(GridTransition):
+    def __init__(self):
+        super().__init__()
+        self.multiplier = 2.5
+
+    def get_pattern(self, size):
+        radius = size * 0.55
+        center = math.ceil(radius) + 1
+        surf = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, 'black', (center, center), radius)
+        pygame.draw.circle(surf, 'white', (center, center), radius, 2)
+        return surf, -center, -center
 
     def draw(self, surf: pygame.Surface, offset, scale=1.0, angle=0.0):
-        for row in range(len(self.circles)):
-            for col in range(len(self.circles[row])):
-                size = self.circles[row][col]
-                pygame.draw.circle(surf, 'black', (col * self.size, row * self.size), size * 0.55)
-                pygame.draw.circle(surf, 'white', (col * self.size, row * self.size), size * 0.55, 2)
+        for (x, y), size in zip(self.origins, (i for row in self.cells for i in row)):
+            pygame.draw.circle(surf, 'black', (x, y), size * 0.55)
+            pygame.draw.circle(surf, 'white', (x, y), size * 0.55, 2)
 
 
 class FadeTransition(Transition):
@@ -0,0 +1,204 @@
+from collections import deque
+
+import pygame
+
+from src.engine.config import *
+from src.engine.utils import *
+
+
+def _slot_field(name):
+    # reads / writes the engine array while bound, the plain attribute otherwise
+    attr, array = '_' + name, name + 's'
+
+    def fget(self):
+        if self._engine is None:
+            return getattr(self, attr)
+        return float(getattr(self._engine, array)[self._slot])
+
+    def fset(self, value):
+        if self._engine is None:
+            setattr(self, attr, value)
+        else:
+            getattr(self._engine, array)[self._slot] = value
+
+    return property(fget, fset)
+
+
+class ValueAnimator:
+    """
+    Eases value towards a target, then through a queue of further targets.
+    Added to an ObjectManager it is stepped by the manager's TweenEngine, otherwise update steps it on its own.
+    """
+    value = _slot_field('value')
+    target = _slot_field('target')
+    rate = _slot_field('rate')
+
+    def __init__(self, value):
+        self._engine: TweenEngine | None = None
+        self._slot = -1
+        self._value = value
+        self._target = value
+        self._rate = 0.1
+        self.next_anim = deque()
+        self.action = None
+        self.alive = True
+
+    def reset(self, value=None):
+        if value:
+            self.value = value
+        self.target = self.value
+        self.next_anim.clear()
+
+    def new_anim(self, target, rate, action):
+        self.next_anim.append((target, rate, action))
+        if self._engine is not None:
+            self._engine.wake(self)
+
+    def then(self, action):
+        self.new_anim(None, None, action)
+        return self
+
+    def set(self, value, action=None):
+        return self.lerp(value, 1, action)
+
+    def lerp(self, to, by=0.5, action=None):
+        self.new_anim(to, by, action)
+        return self
+
+    def on_target_reached(self):
+        """
+        Fires the pending callback and starts the next queued tween.
+        Returns False once there is nothing left to do, so the engine can stop stepping this animator.
+        """
+        if self.action:
+            action, self.action = self.action, None
+            action()
+        if self.next_anim:
+            target, rate, self.action = self.next_anim.popleft()
+            if target is None:
+                self.rate = 1  # then(): hold the current target, the action fires on the next step
+            else:
+                self.target, self.rate = target, rate
+            return True
+        return False
+
+    def update(self, events: list[pygame.event.Event], dt):
+        if self._engine is not None:
+            return  # already stepped by the engine
+        if self.rate == 1:
+            self.value = self.target
+        else:
+            self.value = lerp(self.value, self.target, (1 - (1 - self.rate) ** dt))
+        if abs(self.target - self.value) <= TweenEngine.SNAP:
+            self.value = self.target
+            self.on_target_reached()
+
+    def destroy(self):
+        self.alive = False
+        if self._engine is not None:
+            self._engine.remove(self)
+
+
+class TweenEngine:
+    """
+    Steps every ValueAnimator of an ObjectManager in one batch.
+    Value, target and rate live in parallel arrays indexed by the animator's slot (numpy when available);
+    the queued chain and callbacks stay on the animator and are only touched for tweens that reached their target.
+    Idle animators are put to sleep and cost nothing until a new tween is queued.
+    """
+    SNAP = 0.01  # distance at which a tween snaps to its target
+
+    def __init__(self, capacity=64):
+        self.animators: list[ValueAnimator | None] = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        if NUMPY:
+            self.values = numpy.zeros(capacity)
+            self.targets = numpy.zeros(capacity)
+            self.rates = numpy.zeros(capacity)
+            self.active = numpy.zeros(capacity, dtype=bool)
+        else:
+            self.values = [0.0] * capacity
+            self.targets = [0.0] * capacity
+            self.rates = [0.0] * capacity
+            self.active = [False] * capacity
+
+    def __len__(self):
+        return len(self.animators) - len(self._free)
+
+    def _grow(self):
+        capacity = len(self.animators)
+        self.animators.extend([None] * capacity)
+        self._free.extend(range(capacity * 2 - 1, capacity - 1, -1))
+        if NUMPY:
+            self.values = numpy.concatenate([self.values, numpy.zeros(capacity)])
+            self.targets = numpy.concatenate([self.targets, numpy.zeros(capacity)])
+            self.rates = numpy.concatenate([self.rates, numpy.zeros(capacity)])
+            self.active = numpy.concatenate([self.active, numpy.zeros(capacity, dtype=bool)])
+        else:
+            for array in (self.values, self.targets, self.rates):
+                array.extend([0.0] * capacity)
+            self.active.extend([False] * capacity)
+
+    def add(self, animator: ValueAnimator):
+        if animator._engine is self:
+            return
+        if animator._engine is not None:
+            animator._engine.remove(animator)
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.animators[slot] = animator
+        self.values[slot] = animator._value
+        self.targets[slot] = animator._target
+        self.rates[slot] = animator._rate
+        animator._engine, animator._slot = self, slot
+        self.active[slot] = True
+
+    def remove(self, animator: ValueAnimator):
+        slot = animator._slot
+        # hand the state back so the animator keeps working unbound
+        animator._value, animator._target, animator._rate = animator.value, animator.target, animator.rate
+        animator._engine, animator._slot = None, -1
+        self.animators[slot] = None
+        self.active[slot] = False
+        self._free.append(slot)
+
+    def wake(self, animator: ValueAnimator):
+        self.active[animator._slot] = True
+
+    def clear(self):
+        for animator in self.animators:
+            if animator is not None:
+                self.remove(animator)
+
+    def update(self, dt):
+        if NUMPY:
+            slots = numpy.flatnonzero(self.active)
+            if not len(slots):
+                return
+            value, target, rate = self.values[slots], self.targets[slots], self.rates[slots]
+            factor = 1 - (1 - rate) ** dt
+            factor[rate == 1] = 1
+            value += (target - value) * factor
+            done = numpy.abs(target - value) <= self.SNAP
+            value[done] = target[done]
+            self.values[slots] = value
+            finished = slots[done].tolist()
+        else:
+            finished = []
+            values, targets, rates = self.values, self.targets, self.rates
+            for slot, active in enumerate(self.active):
+                if not active:
+                    continue
+                if rates[slot] == 1:
+                    values[slot] = targets[slot]
+                else:
+                    values[slot] = lerp(values[slot], targets[slot], (1 - (1 - rates[slot]) ** dt))
+                if abs(targets[slot] - values[slot]) <= self.SNAP:
+                    values[slot] = targets[slot]
+                    finished.append(slot)
+        animators = self.animators
+        for slot in finished:
+            animator = animators[slot]
+            if animator is not None and not animator.on_target_reached() and animator._slot == slot:
+                self.active[slot] = False
@@ -11,6 +11,7 @@ from typing import Literal
 import pygame
 
 # FONT = os.path.abspath(os.path.join(ASSETS, 'ARCADECLASSIC.TTF'))
+from src.engine.cache import surface_cache
 from src.engine.config import ASSETS, Config
 
 FONT = 'Gerhaus-PK69E.ttf'
@@ -25,6 +26,13 @@ def get_random(a, b):
 
 lerp = pygame.math.lerp
 slerp = pygame.math.smoothstep
+
+
+def lerp_angle(a, b, t):
+    """lerp for angles in degrees, turning the short way round (350 -> 10 passes through 0, not 180)"""
+    return a + ((b - a + 180) % 360 - 180) * t
+
+
 Point = pygame.Vector2
 
 
@@ -48,6 +56,15 @@ def map_to_range(value, from_x, from_y, to_x, to_y):
     return clamp(value * (to_y - to_x) / (from_y - from_x), to_x, to_y)
 
 
+def run_steps(steps):
+    """Run a step generator (Scene.build, Blueprint.build_steps) to the end and return its result"""
+    try:
+        while True:
+            next(steps)
+    except StopIteration as e:
+        return e.value
+
+
 def load_image_without_cache(path: str, alpha: bool = True, scale=1.0, color_key=None, smooth_scale=False):
     img = pygame.image.load(path)
     img = pygame.transform.scale_by(img, scale) if not smooth_scale else pygame.transform.smoothscale_by(img, scale)
@@ -69,6 +86,14 @@ def get_path(*args):
     return path
 
 
+def get_cache_path(*args):
+    # generated files that can be rebuilt from the assets at any time
+    path = pathlib.Path(__file__).parent.parent.parent / '.cache'
+    for i in args:
+        path /= i
+    return path
+
+
 @lru_cache(maxsize=100)
 def load_image(path: str, alpha: bool = True, scale=1.0, color_key=None, smooth_scale=False):
     img = pygame.image.load(path)
@@ -88,7 +113,7 @@ def load_image(path: str, alpha: bool = True, scale=1.0, color_key=None, smooth_
 _radial_glow = None
 
 
-@lru_cache(maxsize=500)
+@surface_cache('glow')
 def get_radial_glow(radius, color='#D600C4'):
     global _radial_glow
     if not _radial_glow:
@@ -105,7 +130,7 @@ def get_radial_glow(radius, color='#D600C4'):
 _linear_glow = None
 
 
-@lru_cache(maxsize=500)
+@surface_cache('glow')
 def get_linear_vertical_glow(width, height, color='#D600C4'):
     global _linear_glow
     if not _linear_glow:
@@ -123,7 +148,7 @@ def get_linear_vertical_glow(width, height, color='#D600C4'):
 _square_glow = None
 
 
-@lru_cache(maxsize=500)
+@surface_cache('glow')
 def get_rectangle_glow(width, height, color='#D600C4'):
     global _square_glow
     if not _square_glow:
@@ -140,23 +165,23 @@ def get_rectangle_glow(width, height, color='#D600C4'):
 
 @lru_cache(maxsize=10)
 def font(size):
-    return pygame.font.Font(get_path('fonts', 'Gerhaus-PK69E.ttf'), size)
+    return pygame.font.Font(get_path('fonts', FONT), size)
     # return pygame.font.Font(FONT, size)
 
 
-@lru_cache(maxsize=100)
+@surface_cache('text')
 def text(msg, size=50, color=(255, 255, 255), bg_color=None, aliased=True, wraplength=0):
     return font(size).render(str(msg), aliased, color, bg_color, wraplength=wraplength)
 
 
-@lru_cache(maxsize=100)
+@surface_cache('text')
 def text_size_with_outline(msg, size=50, outline_width=1):
     base_width, base_height = font(size).size(str(msg))
     outline_width_total = outline_width * 2 * len(str(msg))
     return base_width + outline_width_total, base_height + outline_width_total
 
 
-@lru_cache(maxsize=100)
+@surface_cache('text')
 def text_with_outline(msg, size, text_color, outline_color, outline_width):
     base = text(msg, size, text_color)
     outline = text(msg, size, outline_color)
@@ -1,10 +1,13 @@
 import math
-import string
+from collections import OrderedDict
 from functools import lru_cache
 
 import pygame
 from pygame._sdl2 import video
 
+from src.engine.assets import AssetManifest, SpriteSheetAsset
+from src.engine.atlas import build_atlas, load_atlas
+from src.engine.glyphs import build_glyph_atlas, load_glyph_atlas
 from src.engine.config import *
 from src.engine.utils import *
 
@@ -13,13 +16,82 @@ class Texture(video.Texture):
     pass
 
 
+class HeadlessTexture:
+    """
+    Stand-in for Texture when running without a renderer.
+    Keeps the size (for get_rect) and the attributes objects set up, drawing does nothing.
+    """
+
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.blend_mode = pygame.BLENDMODE_NONE
+        self.color = pygame.Color('white')
+        self.alpha = 255
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        for i in kwargs:
+            rect.__setattr__(i, kwargs[i])
+        return rect
+
+    def draw(self, *args, **kwargs):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+class HeadlessImage:
+    """Stand-in for Image pointing into a HeadlessTexture"""
+
+    def __init__(self, texture_or_image, srcrect=None):
+        if isinstance(texture_or_image, HeadlessImage):
+            # like Image, the rect is relative to the image it is cut from
+            parent = texture_or_image.srcrect
+            srcrect = pygame.Rect(srcrect).move(parent.topleft) if srcrect is not None else parent.copy()
+            texture_or_image = texture_or_image.texture
+        self.texture = texture_or_image
+        self.srcrect = pygame.Rect(srcrect) if srcrect is not None else texture_or_image.get_rect()
+        self.dstrect = self.srcrect
+        self.angle = 0
+        self.origin = None
+        self.flip_x = self.flip_y = False
+        self.color = pygame.Color('white')
+        self.alpha = 255
+        self.blend_mode = texture_or_image.blend_mode
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect(0, 0, *self.srcrect.size)
+        for i in kwargs:
+            rect.__setattr__(i, kwargs[i])
+        return rect
+
+    def scale_by(self, amt):
+        img = HeadlessImage(self.texture, self.srcrect)
+        img.dstrect = self.get_rect().scale_by(amt)
+        return img
+
+    def rotate_to(self, angle, origin=None):
+        img = HeadlessImage(self.texture, self.srcrect)
+        img.angle = angle
+        img.origin = origin
+        return img
+
+    def render(self, *args, **kwargs):
+        pass
+
+    def draw(self, *args, **kwargs):
+        pass
+
+
 class Image(video.Image):
     def __init__(self, texture_or_image, srcrect):
         super().__init__(texture_or_image, srcrect)
         self.dstrect = self.srcrect
 
     def get_rect(self, **kwargs):
-        rect = super().get_rect()
+        # size only, the srcrect may sit anywhere inside an atlas
+        rect = pygame.Rect(0, 0, *self.srcrect.size)
         for i in kwargs:
             rect.__setattr__(i, kwargs[i])
         return rect
@@ -45,6 +117,36 @@ class Image(video.Image):
         img.draw(None, img.dstrect)
 
 
+class GlyphRun:
+    """
+    A string laid out against a text atlas: the source rect of every glyph and its x offset from the left edge.
+    Typed text only ever grows, so a run can be extended with the new characters instead of laid out again.
+    """
+
+    def __init__(self, size, outline):
+        self.msg = ''
+        self.size = size
+        self.outline = outline
+        self.texture: Texture | None = None
+        self.quads: list[tuple[int, pygame.Rect]] = []
+        self.width = self.height = 0
+        self._advance = 0
+
+    def extend(self, suffix, glyphs: dict[str, Image]):
+        for i in suffix:
+            img = glyphs[i]
+            src = img.srcrect
+            self.quads.append((self._advance, src))
+            self._advance += src.w
+            self.texture = img.texture
+        self.msg += suffix
+        # same box as text_size_with_outline
+        width, height = font(self.size).size(self.msg)
+        border = self.outline * 2 * len(self.msg)
+        self.width, self.height = width + border, height + border
+        return self
+
+
 class Renderer(video.Renderer):
     class TEXTURES:
         # textures
@@ -64,8 +166,16 @@ class Renderer(video.Renderer):
             Renderer.TEXTURES.SQUARE_TEX: self.square_tex(),
             Renderer.TEXTURES.SCREEN_TEX: self.screen_tex(),
         }
-        self.text_atlases = {}
+        self.sheets: dict[SpriteSheetAsset, list[pygame.Rect]] = {}
+        self.atlases: dict[str, tuple[Texture, dict[str, pygame.Rect]]] = {}
+        self.atlas_dirs = {get_path('images', i): i for i in Config.ATLASES}
+        self.text_atlases: dict[tuple[int, int], dict[str, Image]] = {}  # by (size, outline)
+        self.upload_glyphs(*load_glyph_atlas())
+        self.glyph_runs: OrderedDict[tuple[str, int, int], GlyphRun] = OrderedDict()  # LRU
+        self._last_runs: dict[tuple[int, int], GlyphRun] = {}  # most recently laid out run per (size, outline)
         self.full_screen = False
+        self.late_loads = []  # textures loaded outside prewarm, i.e. missing from a manifest
+        self._prewarming = False
 
     @staticmethod
     def render_drivers():
@@ -89,6 +199,13 @@ class Renderer(video.Renderer):
         rect.center = [self.size[0] / 2, self.size[1] / 2]
         return pygame.Vector2(*pygame.mouse.get_pos()) - [*rect.topleft]
 
+    def image(self, texture_or_image, srcrect=None) -> Image:
+        # objects cut their Images through the renderer, so a HeadlessRenderer can hand out its own type
+        return Image(texture_or_image, srcrect)
+
+    def texture_from_surface(self, surface: pygame.Surface) -> Texture:
+        return Texture.from_surface(self, surface)
+
     def square_tex(self):
         s = pygame.Surface([64, 64])
         s.fill('white')
@@ -97,50 +214,54 @@ class Renderer(video.Renderer):
     def screen_tex(self):
         return Texture(self, [Config.WIDTH, Config.HEIGHT], target=True, scale_quality=Config.DEFAULT_TEXTURE_QUALITY)
 
-    def gen_text_tex(self, size, outline=0, max_tex_size=1024):
-        def text_func(msg):
-            if outline:
-                return text_with_outline(msg, size, 'white', 'black', outline)
-            else:
-                return text(msg, size, 'white')
-        chars = {
-            i: text_func(i)
-            for i in string.printable if i == ' ' or i not in string.whitespace
-        }
-        texture = Texture(self, [max_tex_size, max_tex_size], static=True, scale_quality=Config.DEFAULT_TEXTURE_QUALITY)
+    def upload_glyphs(self, page: pygame.Surface, index: dict[tuple[int, int], dict[str, pygame.Rect]]):
+        texture = Texture(self, page.get_size(), static=True, scale_quality=Config.DEFAULT_TEXTURE_QUALITY)
         texture.blend_mode = pygame.BLENDMODE_BLEND
-        surface = pygame.Surface([max_tex_size, max_tex_size], pygame.SRCALPHA)
-        surface.set_colorkey('black')
-        x = y = max_h = 0
-        images = {}
-        for char, surf in chars.items():
-            if x + surf.get_width() > max_tex_size:
-                x = 0
-                y += max_h
-            if y + surf.get_height() > max_tex_size:
-                raise ValueError(f"Unable to fit all text in texture of size = {max_tex_size}")
-            surface.blit(surf, [x, y])
-            max_h = max(max_h, surf.get_height())
-            rect = pygame.Rect(x, y, *surf.get_size())
-            images[char] = Image(texture, rect)
-            x += surf.get_width()
-        texture.update(surface)
-        self.text_atlases[size] = images
+        texture.update(page)
+        for variant, rects in index.items():
+            self.text_atlases[variant] = {char: Image(texture, rect) for char, rect in rects.items()}
+
+    def gen_text_tex(self, size, outline=0):
+        # a variant missing from Config.TEXT_VARIANTS, gets a texture of its own
+        self.upload_glyphs(*build_glyph_atlas([(size, outline)]))
+
+    def get_glyph_run(self, msg: str, size, outline=0) -> GlyphRun:
+        key = msg, size, outline
+        run = self.glyph_runs.get(key)
+        if run is not None:
+            self.glyph_runs.move_to_end(key)
+            return run
+        if (size, outline) not in self.text_atlases:
+            self.gen_text_tex(size, outline)
+        glyphs = self.text_atlases[size, outline]
+        last = self._last_runs.get((size, outline))
+        if last is not None and msg.startswith(last.msg) and self.glyph_runs.get((last.msg, size, outline)) is last:
+            # the string grew since it was last drawn (typed text), lay out only the new characters
+            del self.glyph_runs[last.msg, size, outline]
+            run = last.extend(msg[len(last.msg):], glyphs)
+        else:
+            run = GlyphRun(size, outline).extend(msg, glyphs)
+        self._last_runs[size, outline] = run
+        self.glyph_runs[key] = run
+        if len(self.glyph_runs) > Config.TEXT_RUN_CACHE_SIZE:
+            self.glyph_runs.popitem(last=False)
+        return run
 
     def text(self, msg, size, color, pos, anchor='center', outline=0, wraplength=0):
         if not isinstance(msg, str):
             msg = str(msg)
-        if size not in self.text_atlases:
-            self.gen_text_tex(size, outline)
-        images = self.text_atlases[size]
-        rect = pygame.Rect(*pos, *text_size_with_outline(msg, size, outline))
+        run = self.get_glyph_run(msg, size, outline)
+        if not run.quads:
+            return
+        rect = pygame.Rect(*pos, run.width, run.height)
         rect.__setattr__(anchor, pos)
         x, y = rect.topleft
-        for i in msg:
-            img: Image = images[i]
-            img.color = pygame.Color(color)
-            img.draw(None, img.get_rect(topleft=[x, y]))
-            x += img.get_rect().w
+        # every glyph comes from the same texture, so the copies go out back to back and SDL batches them
+        texture = run.texture
+        texture.color = color
+        draw = texture.draw
+        for dx, src in run.quads:
+            draw(src, (x + dx, y, src.w, src.h))
 
     def rect(self, color, rect, thickness=0):
         if not isinstance(rect, pygame.Rect):
@@ -176,19 +297,140 @@ class Renderer(video.Renderer):
             self.window.set_fullscreen(True)
         self.full_screen = not self.full_screen
 
-    def load_image(self, path) -> Texture:
+    def load_atlas(self, name, rebuild=False):
+        if rebuild or name not in self.atlases:
+            page, rects = build_atlas(name) if rebuild else load_atlas(name)
+            self.atlases[name] = self.texture_from_surface(page), rects
+        return self.atlases[name]
+
+    def _log_load(self, path):
+        if self._prewarming:
+            print(f'loading texture {path}')
+        else:
+            print(f'late texture load {path} (not in the scene\'s asset manifest)')
+            self.late_loads.append(path)
+
+    def load_image(self, path) -> Texture | Image:
+        """
+        Texture for the image at path, loaded once.
+        Images in one of the atlas folders come back as an Image into that folder's atlas instead,
+        so objects drawing from the same folder keep sending the same texture and SDL can batch the copies.
+        """
         if path in self.textures:
             return self.textures[path]
-        print(f'loading texture {path}')
-        img = load_image(path)
-        t = Texture.from_surface(self, img)
+        path = Path(path)
+        atlas = self.atlas_dirs.get(path.parent)
+        if atlas is not None:
+            if atlas not in self.atlases:
+                self._log_load(get_path('images', atlas))
+            tex, rects = self.load_atlas(atlas)
+            if path.name not in rects:
+                # added since the page was packed
+                tex, rects = self.load_atlas(atlas, rebuild=True)
+            t = self.image(tex, rects[path.name])
+        else:
+            self._log_load(path)
+            t = self.texture_from_surface(load_image(path))
         self.textures[path] = t
         return t
 
     def load_spritesheet(self, path, rows, cols, images) -> list[Image]:
         tex = self.load_image(path)
-        img = load_image(path)
-        sheet = SpriteSheet(img, rows, cols, images)
-        sheet.get_images()
-        rects = sheet.get_rects()
-        return [Image(tex, r) for r in rects]
+        key = SpriteSheetAsset(Path(path), rows, cols, images)
+        try:
+            rects = self.sheets[key]
+        except KeyError:
+            sheet = SpriteSheet(load_image(path), rows, cols, images)
+            sheet.get_images()
+            rects = self.sheets[key] = sheet.get_rects()
+        return [self.image(tex, r) for r in rects]
+
+    def prewarm(self, manifest: AssetManifest):
+        """
+        Loads whatever in the manifest isn't loaded yet, one texture or sprite sheet per step.
+        Generator yielding (loaded, total) so callers can spread the work over frames and report progress.
+        """
+        pending = [i for i in manifest.images if i not in self.textures]
+        pending += [i for i in manifest.sheets if i not in self.sheets]
+        for loaded, entry in enumerate(pending, 1):
+            self._prewarming = True
+            try:
+                if isinstance(entry, SpriteSheetAsset):
+                    self.load_spritesheet(*entry)
+                else:
+                    self.load_image(entry)
+            finally:
+                self._prewarming = False
+            yield loaded, len(pending)
+
+
+class HeadlessRenderer:
+    """
+    Renderer stand-in for running scenes without a window.
+    Images are decoded only to learn their sizes (atlases, sprite sheets and glyph runs are laid out as
+    Renderer lays them out, so rects match); every draw call is a no-op.
+    """
+    TEXTURES = Renderer.TEXTURES
+
+    def __init__(self):
+        self.size = [Config.WIDTH, Config.HEIGHT]
+        self.logical_size = [Config.WIDTH, Config.HEIGHT]
+        self.textures = {
+            Renderer.TEXTURES.SQUARE_TEX: HeadlessTexture(64, 64),
+            Renderer.TEXTURES.SCREEN_TEX: HeadlessTexture(Config.WIDTH, Config.HEIGHT),
+        }
+        self.sheets: dict[SpriteSheetAsset, list[pygame.Rect]] = {}
+        self.atlases: dict[str, tuple[HeadlessTexture, dict[str, pygame.Rect]]] = {}
+        self.atlas_dirs = {get_path('images', i): i for i in Config.ATLASES}
+        self.text_atlases: dict[tuple[int, int], dict[str, HeadlessImage]] = {}
+        self.upload_glyphs(*load_glyph_atlas())
+        self.glyph_runs: OrderedDict[tuple[str, int, int], GlyphRun] = OrderedDict()
+        self._last_runs: dict[tuple[int, int], GlyphRun] = {}
+        self.full_screen = False
+        self._prewarming = False
+
+    # the same bookkeeping as the real renderer, on top of the stand-ins below
+    load_atlas = Renderer.load_atlas
+    load_image = Renderer.load_image
+    load_spritesheet = Renderer.load_spritesheet
+    get_glyph_run = Renderer.get_glyph_run
+    gen_text_tex = Renderer.gen_text_tex
+    prewarm = Renderer.prewarm
+
+    def image(self, texture_or_image, srcrect=None) -> HeadlessImage:
+        return HeadlessImage(texture_or_image, srcrect)
+
+    def texture_from_surface(self, surface: pygame.Surface) -> HeadlessTexture:
+        return HeadlessTexture(*surface.get_size())
+
+    def _log_load(self, path):
+        pass
+
+    def upload_glyphs(self, page: pygame.Surface, index: dict[tuple[int, int], dict[str, pygame.Rect]]):
+        texture = HeadlessTexture(*page.get_size())
+        for variant, rects in index.items():
+            self.text_atlases[variant] = {char: HeadlessImage(texture, rect) for char, rect in rects.items()}
+
+    def get_mouse_pos(self):
+        return pygame.Vector2(GAMESTATS.MOUSE_POS)
+
+    def fill(self, color):
+        pass
+
+    def text(self, msg, size, color, pos, anchor='center', outline=0, wraplength=0):
+        pass
+
+    def rect(self, color, rect, thickness=0):
+        pass
+
+    def polygon(self, points, color, fill=False):
+        pass
+
+    def blit(self, *args, **kwargs):
+        pass
+
+    def present(self):
+        pass
+
+    def toggle_full_screen(self):
+        pass
@@ -0,0 +1,123 @@
+import json
+from functools import lru_cache
+
+import pygame
+
+from src.engine.utils import *
+from src.objects import space_station
+from src.objects.space_station import SpaceComponent, SpriteComponent, SpaceStation
+
+# every SpaceComponent class that can appear in a blueprint, by name
+KINDS = {
+    name: cls for name, cls in vars(space_station).items()
+    if isinstance(cls, type) and issubclass(cls, SpaceComponent)
+}
+
+
+class Blueprint:
+    """
+    Flat, column-backed table describing a component tree, one row per component in pre-order
+    (a parent always comes before its children).
+    Columns: kind and sprite (indices into the kinds / sprites string tables), parent (row index, -1 for the root),
+    x, y and angle (local transform relative to the parent), scale and health (sprite components only).
+    """
+    FIELDS = ('kind', 'sprite', 'parent', 'x', 'y', 'angle', 'scale', 'health')
+
+    def __init__(self, kinds=(), sprites=(), **columns):
+        self.kinds = list(kinds)
+        self.sprites = list(sprites)
+        for field in self.FIELDS:
+            setattr(self, field, list(columns.get(field, [])))
+
+    def __len__(self):
+        return len(self.kind)
+
+    @classmethod
+    def from_component(cls, root: SpaceComponent):
+        """Export an existing component tree, keeping its local transforms"""
+        blueprint = cls()
+        kinds, sprites = {}, {}
+
+        def intern(table: dict, names: list, value):
+            if value not in table:
+                table[value] = len(names)
+                names.append(value)
+            return table[value]
+
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            row = len(blueprint)
+            sprite = node.sprite if isinstance(node, SpriteComponent) else ''
+            blueprint.kind.append(intern(kinds, blueprint.kinds, type(node).__name__))
+            blueprint.sprite.append(intern(sprites, blueprint.sprites, sprite))
+            blueprint.parent.append(parent)
+            # the root is stored at the origin, build places it
+            x, y = node.local_pos if parent != -1 else (0, 0)
+            blueprint.x.append(round(x, 4))
+            blueprint.y.append(round(y, 4))
+            blueprint.angle.append(round(node.local_angle, 4))
+            blueprint.scale.append(node.scale)
+            blueprint.health.append(getattr(node, 'health', 0))
+            stack.extend((i, row) for i in reversed(node.components))
+        return blueprint
+
+    def get_assets(self):
+        # sprite textures, for asset manifests
+        return [get_path('images', 'space_station', i) for i in self.sprites if i]
+
+    def to_dict(self):
+        data = {'kinds': self.kinds, 'sprites': self.sprites}
+        data.update({field: getattr(self, field) for field in self.FIELDS})
+        return data
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load_file(cls, path):
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def build(self, x, y) -> SpaceComponent:
+        """Instantiate the tree in one pass over the rows, with the root at (x, y)"""
+        return run_steps(self.build_steps(x, y))
+
+    def build_steps(self, x, y, chunk=Config.BLUEPRINT_CHUNK):
+        """build, yielding after every chunk rows so it can be spread over frames; returns the root"""
+        kinds = [KINDS[i] for i in self.kinds]
+        nodes = []
+        rows = zip(*(getattr(self, i) for i in self.FIELDS))
+        for row, (kind, sprite, parent, lx, ly, angle, scale, health) in enumerate(rows, 1):
+            cls = kinds[kind]
+            # skip the class constructors, they would build their children again
+            node = cls.__new__(cls)
+            if issubclass(cls, SpriteComponent):
+                SpriteComponent.__init__(node, 0, 0, self.sprites[sprite], scale)
+                node.health = health
+            else:
+                SpaceComponent.__init__(node, 0, 0)
+            if parent == -1:
+                node.local_pos.update(x + lx, y + ly)
+                node.local_angle = angle
+                node.invalidate()
+            else:
+                nodes[parent].attach_component(node, pygame.Vector2(lx, ly), angle)
+            nodes.append(node)
+            if row % chunk == 0:
+                yield
+        return nodes[0]
+
+
+@lru_cache()
+def load_blueprint(name) -> Blueprint:
+    # shared between builds, treat as read-only
+    return Blueprint.load_file(get_path('blueprints', f'{name}.json'))
+
+
+if __name__ == '__main__':
+    # python -m src.objects.blueprint (regenerates the station blueprint from the SpaceStation builders)
+    _blueprint = Blueprint.from_component(SpaceStation(0, 0))
+    _blueprint.save(get_path('blueprints', 'space_station.json'))
+    print(f'exported {len(_blueprint)} components')
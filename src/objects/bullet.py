@@ -1,6 +1,8 @@
 import math
 
-from src.engine.objects import BaseObject, AnimationStateObject, TimerObject
+from src.engine.assets import SpriteSheetAsset
+from src.engine.objects import BaseObject, AnimationStateObject
+from src.engine.scheduler import ScheduledCallback
 from src.engine.utils import *
 from src.engine.config import *
 from src.engine.video import Renderer, Image
@@ -9,23 +11,35 @@ from src.objects.space_station import *
 
 
 class Bullet(AnimationStateObject):
+    poolable = True
+    assets = (SpriteSheetAsset(get_path('images', 'ships', 'bullet.png'), 3, 1, 3), Explosion, Spark)
+
     def __init__(self, x, y, angle=0, scale=0.75):
         state_info = {
             'default': range(3)
         }
         super().__init__(get_path('images', 'ships', f'bullet.png'), 3, 1, 3, state_info, scale, 1 / 30)
-        self.pos = x, y
+        self.move_to(x, y, interpolate=False)
         self.angle = angle
         self.dx = math.cos(math.radians(angle))
         self.dy = math.sin(math.radians(angle))
         # self.run_once('default', self.destroy)
-        self.destroy_timer = TimerObject(1, self.destroy, True)
+        self.destroy_timer = ScheduledCallback(1, self.destroy)
+
+    def on_acquire(self, x, y, angle=0, scale=0.75):
+        self.reset_state()
+        self.scale = scale
+        self.move_to(x, y, interpolate=False)
+        self.angle = angle
+        self.dx = math.cos(math.radians(angle))
+        self.dy = math.sin(math.radians(angle))
 
     def on_ready(self):
-        self.object_manager.add(self.destroy_timer)
+        super().on_ready()
+        self.object_manager.scheduler.add(self.destroy_timer)
 
     def destroy(self):
-        self.destroy_timer.destroy()
+        self.destroy_timer.cancel()
         super().destroy()
 
     def get_rect(self):
@@ -39,15 +53,11 @@ class Bullet(AnimationStateObject):
         self.move(dx, dy)
 
     def interact(self, objects: list['BaseObject']):
-        for i in objects:
-            if isinstance(i, SpriteComponent):
-                if i.rect.colliderect(self.rect):
-                    # i.destroy()
-                    i.get_damage(1)
-                    self.destroy()
-                    self.object_manager.add(
-                        Spark(*self.pos, 2)
-                    )
+        for i in self.object_manager.query_rect(self.rect, SpriteComponent):
+            # i.destroy()
+            i.get_damage(1)
+            self.destroy()
+            self.object_manager.acquire(Spark, *self.pos, 2)
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         super().render(renderer, offset, scale, angle + 1 * self.angle)
@@ -1,43 +1,155 @@
+import pygame
+
 from src.engine.objects import BaseObject
+from src.engine.utils import Point
 
 
 class Component(BaseObject):
+    """
+    Node of a rigid hierarchy (the space station).
+    The transform is stored relative to the parent (local_pos in the parent's rotated frame, local_angle);
+    the world transform (x, y, pos, angle) is derived lazily and cached.
+    move / rotate_by only change the local transform and flag the subtree dirty, so moving or rotating the root
+    costs one pass over the nodes instead of rewriting every descendant at every level.
+    """
+
     def __init__(self, x, y, destroy_components=True):
+        self.parent: Component | None = None
+        self.components: list[Component] = []
+        self.live_components = 0  # alive entries of components, kept up to date by the children
+        self.local_pos = pygame.Vector2(x, y)
+        self.local_angle = 0
+        self._world_x, self._world_y, self._world_angle = x, y, 0
+        self._dirty = False  # a dirty node always has a dirty subtree
+        self.object_manager = None
         super().__init__(x, y)
         self.destroy_components = destroy_components  # if this is destroyed, then components too or not
-        self.parent: Component | None = None
-        self.components: list[BaseObject] = []
-        self.angle = 0
         self.scale = 1
 
+    def _resolve(self):
+        parent = self.parent
+        if parent is None:
+            self._world_x, self._world_y = self.local_pos
+            self._world_angle = self.local_angle
+        else:
+            if parent._dirty:
+                parent._resolve()
+            offset = self.local_pos.rotate(parent._world_angle)
+            self._world_x = parent._world_x + offset.x
+            self._world_y = parent._world_y + offset.y
+            self._world_angle = parent._world_angle + self.local_angle
+        self._dirty = False
+
+    def invalidate(self):
+        # the walk stops at nodes that are already dirty, their subtree is too
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._dirty:
+                continue
+            node._dirty = True
+            if node.object_manager is not None:
+                node.object_manager.on_object_moved(node)
+            stack.extend(node.components)
+
+    @property
+    def x(self):
+        if self._dirty:
+            self._resolve()
+        return self._world_x
+
+    @x.setter
+    def x(self, value):
+        self.move(value - self.x, 0)
+
+    @property
+    def y(self):
+        if self._dirty:
+            self._resolve()
+        return self._world_y
+
+    @y.setter
+    def y(self, value):
+        self.move(0, value - self.y)
+
+    @property
+    def pos(self):
+        if self._dirty:
+            self._resolve()
+        return Point(self._world_x, self._world_y)
+
+    @pos.setter
+    def pos(self, position):
+        self.move_to(*position)
+
+    @property
+    def angle(self):
+        if self._dirty:
+            self._resolve()
+        return self._world_angle
+
+    @angle.setter
+    def angle(self, value):
+        self.rotate_by(value - self.angle)
+
     def rotate_by(self, angle):
-        self.angle += angle
-        for i in self.components:
-            i.pos = self.pos + (i.pos - self.pos).rotate(angle)
-            if isinstance(i, Component):
-                i.rotate_by(angle)
+        if angle:
+            self.local_angle += angle
+            self.invalidate()
         return self
 
     def on_ready(self):
         self.object_manager.add_multiple(self.components)
 
     def move(self, dx, dy):
-        for i in self.components:
-            i.move(dx, dy)
-        super().move(dx, dy)
+        if not (dx or dy):
+            return
+        if self.parent is None:
+            self.local_pos.x += dx
+            self.local_pos.y += dy
+        else:
+            self.local_pos += pygame.Vector2(dx, dy).rotate(-self.parent.angle)
+        self.invalidate()
+
+    def add_component(self, component: 'Component'):
+        # keeps the component where it is in the world
+        pos, angle = component.pos, component.angle
+        self.attach_component(component, (pos - self.pos).rotate(-self.angle), angle - self.angle)
 
-    def add_component(self, component: BaseObject):
+    def attach_component(self, component: 'Component', local_pos, local_angle=0):
+        # adds the component with its transform given relative to this one
         self.components.append(component)
-        if isinstance(component, Component):
-            component.parent = self
+        if component.alive:
+            self.live_components += 1
+        component.parent = self
+        component.local_pos = pygame.Vector2(local_pos)
+        component.local_angle = local_angle
+        component.invalidate()
+        self.on_components_changed()
 
-    def remove_component(self, component: BaseObject):
+    def remove_component(self, component: 'Component'):
+        pos, angle = component.pos, component.angle
         self.components.remove(component)
-        if isinstance(component, Component):
-            component.parent = None
+        component.parent = None
+        component.local_pos = pos
+        component.local_angle = angle
+        if component.alive:
+            self.live_components -= 1
+        self.on_components_changed()
+
+    def on_component_destroyed(self, component: 'Component'):
+        self.live_components -= 1
+        self.on_components_changed()
+
+    def on_components_changed(self):
+        # called when a child is attached, destroyed or removed
+        pass
 
     def destroy(self):
+        was_alive = self.alive
+        super().destroy()  # first, so the children destroyed below don't notify a live parent
         if self.destroy_components:
             for i in self.components:
                 i.destroy()
-        super().destroy()
+        if was_alive and self.parent is not None:
+            self.parent.on_component_destroyed(self)
@@ -1,17 +1,31 @@
 from src.objects.vfx import VFX
+from src.engine.assets import SpriteSheetAsset
 from src.engine.sounds import SoundManager
+from src.engine.utils import get_path
 
 class Explosion(VFX):
+    assets = (SpriteSheetAsset(get_path('images', 'vfx', 'sheet.png'), 2, 8, 14),)
+
     def __init__(self, x, y, scale=1):
         super().__init__(x, y, 'sheet', 2, 8, 14, 1 / 24, scale)
 
+    def on_acquire(self, x, y, scale=1):
+        self.restart(x, y, scale)
+
     def on_ready(self):
-        SoundManager.play('explosion')
+        super().on_ready()
+        SoundManager.play_at('explosion', self.pos, self.object_manager.camera)
 
 
 class Spark(VFX):
+    assets = (SpriteSheetAsset(get_path('images', 'vfx', 'spark_smooth.png'), 1, 9, 9),)
+
     def __init__(self, x, y, scale=1):
         super().__init__(x, y, 'spark_smooth', 1, 9, 9, 1 / 24, scale / 8)
 
+    def on_acquire(self, x, y, scale=1):
+        self.restart(x, y, scale / 8)
+
     def on_ready(self):
-        SoundManager.play('spark')
+        super().on_ready()
+        SoundManager.play_at('spark', self.pos, self.object_manager.camera)
@@ -16,14 +16,15 @@ class Laser(BaseObject):
         self.rate = 5
         self.length = 0
         self.max_length = 400
-        self.tex: Texture | None = None
+        self.tex: Image | None = None
         self.angle = 0
 
         self.start = pygame.Vector2(*self.pos)
         self.end = self.start.copy()
 
     def on_renderer_ready(self, renderer: Renderer):
-        self.tex = renderer.load_image(get_path('images', 'ships', 'laser.png'))
+        tex = renderer.load_image(get_path('images', 'ships', 'laser.png'))
+        self.tex = renderer.image(tex, tex.get_rect())
         self.tex.blend_mode = pygame.BLENDMODE_BLEND
         self.tex.color = 'red'
 
@@ -49,4 +50,6 @@ class Laser(BaseObject):
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         rect = pygame.Rect(0, 0, self.length * scale, 10 * scale)
         rect.midleft = self.start + offset
-        self.tex.draw(None, rect, self.angle + angle, origin=[0, 5 * scale])
+        self.tex.angle = self.angle + angle
+        self.tex.origin = [0, 5 * scale]
+        self.tex.draw(None, rect)
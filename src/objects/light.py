@@ -17,7 +17,7 @@ class SpotLight(BaseObject):
     def on_renderer_ready(self, renderer: Renderer):
         self.glow = renderer.load_image(get_path('images', 'glow', 'radial-glow.png'))
         self.glow.blend_mode = pygame.BLENDMODE_ADD
-        self.glow = Image(self.glow, self.glow.get_rect())
+        self.glow = renderer.image(self.glow, self.glow.get_rect())
 
     def render_glow(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.glow.render(*(self.pos + offset), angle, self.scale * scale)
@@ -1,6 +1,7 @@
 import pygame
 
 from src.engine.objects import *
+from src.engine.scheduler import ScheduledCallback
 from src.engine.video import *
 from src.objects.bullet import Bullet
 from src.engine.sounds import SoundManager
@@ -11,6 +12,8 @@ from src.objects.space_station import SpriteComponent
 
 
 class Player(BaseObject):
+    assets = (get_path('images', 'ships', 'spaceship.png'), get_path('images', 'ships', 'spaceship_guns.png'), Bullet)
+
     def __init__(self, x, y):
         super().__init__(x, y, True)
         self.z = LAYERS.PLAYER_LAYER
@@ -26,21 +29,24 @@ class Player(BaseObject):
         self.mode = 'explore'
 
         # pygame.key.set_repeat(100, 50)
-        self.bullet_timer = TimerObject(0.2, self.shoot)
+        self.bullet_timer = ScheduledCallback(0.2, self.shoot, repeat=True)
         # self.laser = Laser(*self.pos)
 
     @property
     def camera(self):
         return self.object_manager.camera
 
-    # def on_ready(self):
-    #     self.object_manager.add(self.laser)
+    def on_ready(self):
+        self.object_manager.scheduler.add(self.bullet_timer)
+        self.object_manager.add(self.gun_scale)
+        self.object_manager.add(self.ship_scale)
+        # self.object_manager.add(self.laser)
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'ships', 'spaceship.png'))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
         img = renderer.load_image(get_path('images', 'ships', 'spaceship_guns.png'))
-        self.gun_img = Image(img, img.get_rect())
+        self.gun_img = renderer.image(img, img.get_rect())
 
     def shoot(self):
         if self.mode != 'shoot':
@@ -56,11 +62,7 @@ class Player(BaseObject):
         ]
         for i in offsets:
             pos = self.pos + pygame.Vector2(*i).rotate(self.angle)
-            self.object_manager.add(
-                Bullet(
-                    *pos, self.angle
-                )
-            )
+            self.object_manager.acquire(Bullet, *pos, self.angle)
         SoundManager.play('shoot')
         self.camera.camera_shake(1)
         # self.object_manager.add(
@@ -69,8 +71,7 @@ class Player(BaseObject):
 
     def smartbomb(self):
         for i in self.object_manager.get_objects(SpriteComponent):
-            if isinstance(i, SpriteComponent):
-                i.get_damage(1)
+            i.get_damage(1)
 
     def update(self, events: list[pygame.event.Event], dt):
         # if self.mode == 'explore':
@@ -78,9 +79,6 @@ class Player(BaseObject):
         # else:
         #     self.camera.set_zoom(2)
         # self.camera.set_zoom(2.5 - self.vel.magnitude() / 8)
-        self.bullet_timer.update(events, dt)
-        self.gun_scale.update(events, dt)
-        self.ship_scale.update(events, dt)
         keys = pygame.key.get_pressed()
         speed = 0.3 * dt
         dx = math.cos(math.radians(self.angle)) * speed * dt
@@ -116,8 +114,7 @@ class Player(BaseObject):
         self.angular_vel *= 0.9 ** dt
         self.pos += self.vel
         offset = 400
-        self.x = clamp(self.x, -offset, Config.WIDTH + offset)
-        self.y = clamp(self.y, -offset, Config.HEIGHT + offset)
+        self.move_to(clamp(self.x, -offset, Config.WIDTH + offset), clamp(self.y, -offset, Config.HEIGHT + offset))
         self.angle += self.angular_vel * dt
 
         # self.laser.angle = self.angle
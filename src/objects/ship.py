@@ -30,7 +30,7 @@ class Ship(BaseObject):
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'ships', f'ship{self.ship_n}.png'))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
 
     def update(self, events: list[pygame.event.Event], dt):
         pass
@@ -43,10 +43,8 @@ class Ship(BaseObject):
         if self.flip:
             offset.x *= -1
             k = -1
-        self.object_manager.add(
-            Bullet(self.x + offset.x, self.y + offset.y, 10 * k)
-        )
-        SoundManager.play('shoot')
+        self.object_manager.acquire(Bullet, self.x + offset.x, self.y + offset.y, 10 * k)
+        SoundManager.play_at('shoot', self.pos, self.object_manager.camera)
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.img.render(*(self.pos + offset), angle, self.scale * scale, (self.flip, 0))
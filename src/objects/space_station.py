@@ -10,37 +10,51 @@ _scale = 4
 
 
 class SpaceComponent(Component):
+    detach_when_dismantled = True  # leaves its parent when hit, False keeps it attached (drifting in place)
+
     def __init__(self, x, y):
         super().__init__(x, y)
         self.velocity = pygame.Vector2()
         self.angular_velocity = 0
         self.dismantled = False
+        self.collapse_pending = True  # checked once on the first update, then only after changes
 
     def get_min_components(self):
         return 2
 
     def dismantle(self):
         self.dismantled = True
-        if self.parent:
-            self.parent.remove_component(self)
-        else:
+        if not self.parent:
             print(self)
+        elif self.detach_when_dismantled:
+            self.parent.remove_component(self)
         self.velocity = pygame.Vector2(1, 1).rotate(get_random(0, 360)) * get_random(0.1, 0.2)
         self.angular_velocity = get_random(-1, 1)
 
+    def on_components_changed(self):
+        # checked on the next update, once the rest of this tick's damage (or building) has landed,
+        # so an intact station costs nothing per frame
+        self.collapse_pending = True
+
     def update(self, events: list[pygame.event.Event], dt):
-        if self.components and all([(not i.alive) for i in self.components]):
-            self.destroy()
+        if self.collapse_pending:
+            self.collapse_pending = False
+            if self.components and not self.live_components:
+                self.destroy()
+            elif not isinstance(self, SpriteComponent) and len(self.components) < self.get_min_components():
+                self.destroy()
+        if not self.dismantled:
+            return  # only dismantled pieces drift
         self.pos += self.velocity * dt
         self.angle += self.angular_velocity * dt
         center = pygame.Vector2(*Config.SCREEN_RECT.center)
         if center.distance_to(self.pos) >= 1000:
             self.velocity *= 0
-        if not isinstance(self, SpriteComponent) and len(self.components) < self.get_min_components():
-            self.destroy()
 
 
 class SpriteComponent(SpaceComponent):
+    collidable = True
+
     def __init__(self, x, y, sprite, scale: float = _scale):
         super().__init__(x, y)
         self.img: Image | None = None
@@ -67,11 +81,18 @@ class SpriteComponent(SpaceComponent):
         self.scale_animator.lerp(self.scale + 1, rate).lerp(self.scale, rate)
 
     def get_rect(self):
-        return self.img.texture.get_rect(center=self.pos).scale_by(1.5)
+        return self.img.get_rect(center=self.pos).scale_by(1.5)
+
+    def get_render_rect(self):
+        # diagonal-sized square so the bounds hold for any rotation
+        size = math.hypot(*self.img.srcrect.size) * self.scale_animator.value
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = self.pos
+        return rect
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'space_station', self.sprite))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.img.render(*(self.pos + offset), self.angle + angle, self.scale_animator.value * scale)
@@ -81,7 +102,7 @@ class SpriteComponent(SpaceComponent):
             super().destroy()
             return
         size = pygame.Vector2().distance_to([*self.img.get_rect().size]) * self.scale / 40
-        self.object_manager.add(Explosion(*self.pos, size))
+        self.object_manager.acquire(Explosion, *self.pos, size)
         self.scale_animator.destroy()
         super().destroy()
 
@@ -173,6 +194,9 @@ class Segment(SpriteComponent):
 
 
 class HeatRejectionSubsystem(SpriteComponent):
+    # hit panels stay on the radiator, which only collapses once all of them are dead
+    detach_when_dismantled = False
+
     def __init__(self, x, y):
         super().__init__(x, y, 'heat_rejection_subsystem.png', _scale / 2)
 
@@ -181,7 +205,7 @@ class HeatRejectionSubsystemRadiator(SpaceComponent):
     def __init__(self, x, y):
         super().__init__(x, y)
         for i in range(-4, 4):
-            self.components.append(HeatRejectionSubsystem(self.pos.x, self.pos.y + i * _scale / 2 * 6.5))
+            self.add_component(HeatRejectionSubsystem(self.pos.x, self.pos.y + i * _scale / 2 * 6.5))
 
 
 class Module(SpriteComponent):
@@ -3,11 +3,21 @@ from src.engine.utils import get_path
 
 
 class VFX(AnimationStateObject):
+    poolable = True
+
     def __init__(self, x, y, name, rows, cols, images, timer=0.1, scale=1, flip=(0, 0)):
         state_info = {
             'default': range(images)
         }
         super().__init__(get_path('images', 'vfx', f'{name}.png'), rows, cols, images, state_info, scale, timer)
-        self.pos = x, y
+        self.move_to(x, y, interpolate=False)
+        self.flip = flip
+        self.run_once('default', self.destroy)
+
+    def restart(self, x, y, scale=1, flip=(0, 0)):
+        # pooled reuse; keeps the spritesheet images that are already loaded
+        self.reset_state()
+        self.scale = scale
+        self.move_to(x, y, interpolate=False)
         self.flip = flip
         self.run_once('default', self.destroy)
@@ -6,6 +6,7 @@ from src.engine.video import Renderer
 from src.objects.bullet import Bullet
 from src.engine.sounds import SoundManager
 from src.engine.objects import *
+from src.engine.scheduler import ScheduledCallback
 
 from src.objects.space_station import *
 from src.objects.player import Player
@@ -18,32 +19,40 @@ _skip_ready = False
 
 
 class Planet(BaseObject):
+    cullable = False
+    assets = (get_path('images', 'space', 'planet4.png'),)
+
     def __init__(self, x, y):
         super().__init__(x, y, -1)
         self.img: Image | None = None
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'space', 'planet4.png'))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.img.render(*(self.pos + offset * 0.75), angle, scale * 1)
 
 
 class Desktop(BaseObject):
+    cullable = False
+    assets = (get_path('images', 'pc', 'desktop.png'),)
+
     def __init__(self, x, y):
         super().__init__(x, y, -1)
         self.img: Image | None = None
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'pc', 'desktop.png'))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.img.render(*(self.pos + offset * 0.4), angle, scale * 4)
 
 
 class MessageApp(BaseObject):
+    cullable = False
+
     def __init__(self, x=Config.WIDTH / 2, y=Config.HEIGHT / 2):
         super().__init__(x, y)
         self.box_scale = ValueAnimator(0.1).lerp(1, 0.25, lambda: self.__setattr__('draw_text', True))
@@ -65,11 +74,13 @@ class MessageApp(BaseObject):
         self.message = '\n'.join(map(str.strip, self.message.split('\n')))
         self.draw_text = False
         self.c = 0
-        self.timer = TimerObject(0.02, action=self.increment_c)
+        self.lines = []  # the typed part of the message, split only when it grows
+        self.timer = ScheduledCallback(0.02, self.increment_c, repeat=True)
         self.message_speak = False
 
     def on_ready(self):
         SoundManager.play('popup')
+        self.object_manager.add(self.box_scale)
 
     def increment_c(self):
         global _skip_ready
@@ -77,15 +88,15 @@ class MessageApp(BaseObject):
         if self.c >= len(self.message):
             self.c = len(self.message) - 1
             _skip_ready = True
+        self.lines = [i.strip() for i in self.message[:self.c].split('\n')]
 
     def update(self, events: list[pygame.event.Event], dt):
-        self.box_scale.update(events, dt)
         if self.draw_text:
             if not self.message_speak:
                 self.message_speak = True
                 SoundManager.stop('contract_message')
                 SoundManager.play('contract_message')
-            self.timer.update(events, dt)
+                self.object_manager.scheduler.add(self.timer)
 
     def get_rect(self):
         r = pygame.Rect(0, 0, 800, 500)
@@ -96,10 +107,8 @@ class MessageApp(BaseObject):
         renderer.rect([11] * 3, self.rect.scale_by(self.box_scale.value))
         renderer.rect([255] * 3, self.rect.scale_by(self.box_scale.value), 2)
         rect = self.rect
-        messages = self.message[:self.c].split('\n')
         if self.draw_text:
-            for i, msg in enumerate(messages):
-                msg = msg.strip()
+            for i, msg in enumerate(self.lines):
                 renderer.text(msg, Config.SMALL_TEXT, 'white', [rect.left + 25, rect.top + i * (Config.SMALL_TEXT + 5)],
                               'topleft')
         if self.c == len(self.message) - 1:
@@ -108,6 +117,8 @@ class MessageApp(BaseObject):
 
 
 class Notification(BaseObject):
+    cullable = False
+
     def __init__(self):
         super().__init__(0, Config.HEIGHT - 5)
         self.messages = [
@@ -121,6 +132,7 @@ class Notification(BaseObject):
 
     def on_ready(self):
         SoundManager.play('notification')
+        self.object_manager.add(self.target_x)
 
     def open(self):
         self.target_x.reset(0)
@@ -131,8 +143,7 @@ class Notification(BaseObject):
         self.target_x.set(Config.WIDTH - 5).lerp(Config.WIDTH - 5 + 450, 0.1)
 
     def update(self, events: list[pygame.event.Event], dt):
-        self.target_x.update(events, dt)
-        self.x = self.target_x.value
+        self.move_to(self.target_x.value, self.y)
         rect = pygame.Rect(0, 0, 400, 110)
         rect.bottomright = self.pos
         if not self.done:
@@ -162,6 +173,9 @@ class Notification(BaseObject):
 
 
 class AcceptContract(Scene):
+    next_scenes = ('game',)
+    assets = (Desktop,)
+
     def __init__(self, manager, name):
         super().__init__(manager, name)
         self.object_manager.create_walls_around_rect(Config.SCREEN_RECT, 50)
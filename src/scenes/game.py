@@ -7,55 +7,73 @@ from src.engine.video import Renderer
 from src.objects.bullet import Bullet
 
 from src.objects.space_station import *
+from src.objects.blueprint import load_blueprint
 from src.objects.player import Player
 
 
 class Planet(BaseObject):
+    cullable = False
+    assets = (get_path('images', 'space', 'planet4.png'),)
+
     def __init__(self, x, y):
         super().__init__(x, y, -1)
         self.img: Image | None = None
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'space', 'planet4.png'))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.img.render(*(self.pos + offset * 0.75), angle, scale * 1)
 
 
 class Dust(BaseObject):
+    cullable = False
+    assets = (get_path('images', 'space', 'dust.png'),)
+
     def __init__(self, x, y):
         super().__init__(x, y, -1)
         self.img: Image | None = None
 
     def on_renderer_ready(self, renderer: Renderer):
         img = renderer.load_image(get_path('images', 'space', 'dust.png'))
-        self.img = Image(img, img.get_rect())
+        self.img = renderer.image(img, img.get_rect())
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         self.img.render(*(self.pos + offset * 0.4), angle, scale * 2.5)
 
 
 class Game(Scene):
+    use_template = True
+    assets = (Dust, Planet, Player)
+
+    def get_manifest(self):
+        return super().get_manifest().add(*load_blueprint('space_station').get_assets())
+
     def __init__(self, manager, name):
         super().__init__(manager, name)
-        self.object_manager.create_walls_around_rect(Config.SCREEN_RECT, 50)
         x, y = Config.WIDTH / 2, Config.HEIGHT / 2
+        self.camera.set_position([x, y], force=True)
+        self.camera.set_zoom(1, factor=0.1, force=True)
+        self.player: Player | None = None
+        self.tex = None
 
+        self.camera_zoom = 1
+
+    def build(self):
+        self.object_manager.create_walls_around_rect(Config.SCREEN_RECT, 50)
+        yield
+        x, y = Config.WIDTH / 2, Config.HEIGHT / 2
+        station = yield from load_blueprint('space_station').build_steps(x, y)
         self.object_manager.add_multiple(
             [
                 Dust(x, y),
                 Planet(x, y),
-                SpaceStation(x, y),
+                station,
                 p := Player(x, y * 1.5)
             ]
         )
-        self.camera.set_position([x, y], force=True)
-        self.camera.set_zoom(1, factor=0.1, force=True)
         self.player = p
-        self.tex = None
-
-        self.camera_zoom = 1
 
     def enter(self):
         SoundManager.play_bg('music.ogg', loops=-1, volume=25)
@@ -77,15 +95,13 @@ class Game(Scene):
         #     self.camera.increase_rotation(-1 * dt)
         # self.camera.set_rotation(-self.player.angle - 90, 0.1)
         self.camera.set_position(self.player.pos, 0.1)
-        c = 0
-        for i in self.object_manager.get_objects(Bullet):
-            c += 1
+        c = self.object_manager.count_objects(Bullet)
         # print(c)
 
     def render(self, renderer: Renderer, offset, scale=1.0, angle=0.0):
         renderer.fill('black')
         super().render(renderer, offset, scale, angle)
-        renderer.text(f'{(c := len([*self.object_manager.get_objects(SpriteComponent)]))} Remaining', Config.MEDIUM_TEXT, 'white', [5, 5], 'topleft')
+        renderer.text(f'{(c := self.object_manager.count_objects(SpriteComponent))} Remaining', Config.MEDIUM_TEXT, 'white', [5, 5], 'topleft')
         if c == 0:
             renderer.text('Destroyed All Components!', Config.LARGE_TEXT, 'white', [Config.WIDTH / 2, Config.HEIGHT / 2])
             renderer.text('Press R to Replay!', Config.SMALL_TEXT, 'white', [Config.WIDTH / 2, Config.HEIGHT / 2 + 100])